@@ -7,11 +7,29 @@ that doesn't require vector databases or embedding models.
 
 __version__ = "0.1.0"
 
-from .docpixie import DocPixie
-from .models.document import Document, Page, QueryResult, QueryMode
-from .models.agent import ConversationMessage
-from .core.config import DocPixieConfig
-from .providers import BaseProvider, create_provider
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .docpixie import DocPixie
+    from .models.document import Document, Page, QueryResult, QueryMode
+    from .models.agent import ConversationMessage
+    from .core.config import DocPixieConfig
+    from .providers import BaseProvider, create_provider
+
+# Public names are resolved on first access so that importing a submodule
+# (e.g. the CLI) does not pull in the processing and provider stack
+_LAZY_ATTRIBUTES = {
+    "DocPixie": ".docpixie",
+    "Document": ".models.document",
+    "Page": ".models.document",
+    "QueryResult": ".models.document",
+    "QueryMode": ".models.document",
+    "ConversationMessage": ".models.agent",
+    "DocPixieConfig": ".core.config",
+    "BaseProvider": ".providers",
+    "create_provider": ".providers",
+}
 
 __all__ = [
     "DocPixie",
@@ -23,4 +41,17 @@ __all__ = [
     "DocPixieConfig",
     "BaseProvider",
     "create_provider"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
\ No newline at end of file
@@ -1,14 +1,19 @@
 """
 DocPixie Adaptive RAG Agent
 Main orchestrator for vision-based document analysis with adaptive task planning
+
+The pipeline is bound by provider round-trips, not Python work, so the
+orchestrator overlaps independent I/O (e.g. loading documents from storage
+while the query is being classified) instead of micro-optimising formatting.
 """
 
 import time
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 
 from ..models.agent import (
-    ConversationMessage, TaskPlan, TaskResult, AgentQueryResult, TaskStatus
+    ConversationMessage, TaskPlan, TaskResult, AgentQueryResult
 )
 from ..models.document import Document, Page
 from ..providers.base import BaseProvider
@@ -54,7 +59,7 @@ class PixieRAGAgent:
         self.context_processor = ContextProcessor(provider, config)
         self.query_reformulator = QueryReformulator(provider)
         self.query_classifier = QueryClassifier(provider)
-        self.task_planner = TaskPlanner(provider)
+        self.task_planner = TaskPlanner(provider, config)
         self.page_selector = VisionPageSelector(provider, config)
         self.synthesizer = ResponseSynthesizer(provider)
 
@@ -87,6 +92,10 @@ class PixieRAGAgent:
         start_time = time.time()
         total_cost = 0.0  # Track total cost for this query
 
+        # Documents don't depend on any LLM step, so load them while the
+        # context/reformulation/classification round-trips are in flight
+        documents_task = asyncio.ensure_future(self.storage.get_all_documents())
+
         try:
             logger.info(f"Processing query: {query[:100]}...")
 
@@ -119,7 +128,7 @@ class PixieRAGAgent:
                 return self._create_direct_answer_result(query, classification["reasoning"], total_cost)
 
             # Step 4: Get all available documents and pages
-            documents = await self.storage.get_all_documents()
+            documents = await documents_task
 
             if not documents:
                 logger.warning("No documents available for analysis")
@@ -169,6 +178,13 @@ class PixieRAGAgent:
             processing_time = time.time() - start_time
             return self._create_error_result(query, str(e), processing_time)
 
+        finally:
+            if not documents_task.done():
+                documents_task.cancel()
+            elif not documents_task.cancelled():
+                # Retrieve a load error the direct-answer path never awaited
+                documents_task.exception()
+
     async def _execute_adaptive_plan(
         self,
         task_plan: TaskPlan,
@@ -193,7 +209,7 @@ class PixieRAGAgent:
                 break
 
             logger.info(f"Executing task: {current_task.name}")
-            current_task.status = TaskStatus.IN_PROGRESS
+            task_plan.mark_task_in_progress(current_task.id)
 
             # Report task starting
             if task_update_callback:
@@ -205,7 +221,7 @@ class PixieRAGAgent:
             )
 
             # Mark task completed
-            current_task.status = TaskStatus.COMPLETED
+            task_plan.mark_task_completed(current_task.id)
             task_results.append(task_result)
 
             logger.info(f"Task completed: {current_task.name} "
@@ -99,6 +99,9 @@ INSTRUCTIONS:
 
 Answer the user's question now."""
 
+# One section of {results_text} per task result, filled with %-formatting
+SYNTHESIS_RESULT_SECTION = "TASK %d: %s\nDescription: %s\nAnalysis: %s\n\n---"
+
 # =============================================================================
 # NEW PROMPTS - For adaptive agent functionality
 # =============================================================================
@@ -219,6 +222,9 @@ AVAILABLE DOCUMENTS:
 
 Create your initial task plan now. Remember: use the MINIMUM number of tasks needed. Only create multiple tasks if they require fundamentally different information from different sources. Output only valid JSON and do not include any other text or even backticks like ```json, ONLY THE JSON."""
 
+# Sections are ordered from stable to volatile (instructions, query and documents,
+# then append-only progress, then per-iteration status and findings) so successive
+# update calls share the longest possible cacheable prefix
 ADAPTIVE_PLAN_UPDATE_PROMPT = """You are an adaptive agent updating your task plan based on new information. Analyze what you've learned and decide if you need to modify your remaining tasks.
 
 DECISION RULES:
@@ -227,41 +233,22 @@ DECISION RULES:
 3. REMOVE TASKS: If completed tasks already answered what remaining tasks were meant to find
 4. MODIFY TASKS: If remaining tasks need to be more focused or different
 
-Based on your latest findings, what should you do with your task plan?
-
-OUTPUT FORMAT - Choose ONE:
+You may combine adding, removing and modifying tasks in a single update. Leave a list empty if you don't need that kind of change; leave all three empty to continue unchanged.
 
-Option 1 - Continue unchanged:
-{{
-  "action": "continue",
-  "reason": "Brief explanation why current plan is still good"
-}}
+Based on your latest findings, what should you do with your task plan?
 
-Option 2 - Add new tasks:
+OUTPUT FORMAT:
 {{
-  "action": "add_tasks",
-  "reason": "Why new tasks are needed",
-  "new_tasks": [
+  "reason": "Brief explanation of your decision",
+  "add": [
     {{
       "name": "Task name",
       "description": "What this new task should find",
       "document": "document_id_to_search"
     }}
-  ]
-}}
-
-Option 3 - Remove tasks:
-{{
-  "action": "remove_tasks",
-  "reason": "Why these tasks are no longer needed",
-  "tasks_to_remove": ["task_id_1", "task_id_2"]
-}}
-
-Option 4 - Modify tasks:
-{{
-  "action": "modify_tasks",
-  "reason": "Why tasks need to be changed",
-  "modified_tasks": [
+  ],
+  "remove": ["task_id_1", "task_id_2"],
+  "modify": [
     {{
       "task_id": "existing_task_id",
       "new_name": "Updated name",
@@ -277,15 +264,15 @@ ORIGINAL QUERY: {original_query}
 AVAILABLE DOCUMENTS:
 {available_documents}
 
+PROGRESS SO FAR:
+{progress_summary}
+
 CURRENT TASK PLAN STATUS:
 {current_plan_status}
 
 LATEST TASK COMPLETED:
 Task: {completed_task_name}
 Findings: {task_findings}
-
-PROGRESS SO FAR:
-{progress_summary}
 ----------------
 
 Analyze your situation and decide what to do. Output only valid JSON and do not include any other text or even backticks like ```json."""
@@ -474,3 +461,61 @@ QUERY: {query}
 ----------------
 
 Note: Do not add ```json to your response under any circumstances. Analyze and output only valid JSON."""
+
+
+# =============================================================================
+# STRUCTURED OUTPUT SCHEMAS - Passed as json_schema to providers that support it
+# =============================================================================
+
+_TASK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "document": {"type": "string"}
+    },
+    "required": ["name", "description", "document"],
+    "additionalProperties": False
+}
+
+ADAPTIVE_INITIAL_PLAN_SCHEMA = {
+    "name": "initial_task_plan",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "tasks": {"type": "array", "items": _TASK_SCHEMA}
+        },
+        "required": ["tasks"],
+        "additionalProperties": False
+    }
+}
+
+ADAPTIVE_PLAN_UPDATE_SCHEMA = {
+    "name": "task_plan_update",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "reason": {"type": "string"},
+            "add": {"type": "array", "items": _TASK_SCHEMA},
+            "remove": {"type": "array", "items": {"type": "string"}},
+            "modify": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "task_id": {"type": "string"},
+                        "new_name": {"type": ["string", "null"]},
+                        "new_description": {"type": ["string", "null"]},
+                        "new_document": {"type": ["string", "null"]}
+                    },
+                    "required": ["task_id", "new_name", "new_description", "new_document"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["reason", "add", "remove", "modify"],
+        "additionalProperties": False
+    }
+}
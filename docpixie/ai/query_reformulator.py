@@ -7,7 +7,7 @@ import logging
 
 from ..providers.base import BaseProvider
 from ..exceptions import QueryReformulationError
-from ..core.utils import sanitize_llm_json
+from ..core.utils import parse_llm_json
 from .prompts import QUERY_REFORMULATION_PROMPT, SYSTEM_QUERY_REFORMULATOR
 
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ class QueryReformulator:
             # Parse JSON response
             result = None
             try:
-                result = json.loads(sanitize_llm_json(response))
+                result = parse_llm_json(response)
                 reformulated = result.get("reformulated_query", current_query)
 
                 logger.info(f"Query reformulation: '{current_query}' → '{reformulated}'")
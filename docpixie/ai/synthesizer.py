@@ -8,10 +8,12 @@ from typing import List
 
 from ..models.agent import TaskResult
 from ..providers.base import BaseProvider
-from .prompts import SYNTHESIS_PROMPT, SYSTEM_SYNTHESIS
+from .prompts import SYNTHESIS_PROMPT, SYNTHESIS_RESULT_SECTION, SYSTEM_SYNTHESIS
 
 logger = logging.getLogger(__name__)
 
+_SYNTHESIS_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_SYNTHESIS}
+
 
 class ResponseSynthesizer:
     """
@@ -54,7 +56,7 @@ class ResponseSynthesizer:
             )
 
             messages = [
-                {"role": "system", "content": SYSTEM_SYNTHESIS},
+                _SYNTHESIS_SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ]
 
@@ -75,17 +77,10 @@ class ResponseSynthesizer:
 
     def _build_results_text(self, task_results: List[TaskResult]) -> str:
         """Build formatted text from all task results"""
-        results_sections = []
-
-        for i, result in enumerate(task_results, 1):
-            section = f"""TASK {i}: {result.task.name}
-Description: {result.task.description}
-Analysis: {result.analysis}
-
----"""
-            results_sections.append(section)
-
-        return "\n".join(results_sections)
+        return "\n".join(
+            SYNTHESIS_RESULT_SECTION % (i, result.task.name, result.task.description, result.analysis)
+            for i, result in enumerate(task_results, 1)
+        )
 
     def _create_fallback_response(
         self,
@@ -3,24 +3,249 @@ Adaptive task planner for DocPixie RAG Agent
 Creates and dynamically updates task plans based on agent findings
 """
 
+import os
 import json
-import uuid
+import time
+import itertools
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional
-
-from ..models.agent import AgentTask, TaskPlan, TaskResult, TaskStatus
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.agent import (
+    AgentTask, TaskPlan, TaskResult, TaskStatus, TaskSpec,
+    InitialPlanResponse, PlanUpdateResponse
+)
 from ..models.document import Document
 from ..providers.base import BaseProvider
+from ..core.config import DocPixieConfig
 from ..exceptions import TaskPlanningError
-from ..core.utils import sanitize_llm_json
+from ..core.utils import compile_prompt_template, parse_llm_json, truncate_to_tokens
 from .prompts import (
     ADAPTIVE_INITIAL_PLANNING_PROMPT,
     ADAPTIVE_PLAN_UPDATE_PROMPT,
+    ADAPTIVE_INITIAL_PLAN_SCHEMA,
+    ADAPTIVE_PLAN_UPDATE_SCHEMA,
     SYSTEM_ADAPTIVE_PLANNER
 )
 
 logger = logging.getLogger(__name__)
 
+# Above this many documents the summary text is built off the event loop
+_DOCUMENTS_TEXT_OFFLOAD_THRESHOLD = 100
+
+# Built once and reused by every planner request
+_PLANNER_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_ADAPTIVE_PLANNER}
+
+# Planner prompts are rendered every iteration, so parse the templates once at import
+_render_initial_planning_prompt = compile_prompt_template(ADAPTIVE_INITIAL_PLANNING_PROMPT)
+_render_plan_update_prompt = compile_prompt_template(ADAPTIVE_PLAN_UPDATE_PROMPT)
+
+
+class _StreamingTaskParser:
+    """
+    Incremental scanner for {"tasks": [{...}, ...]} responses
+    Emits each task object as soon as its closing brace arrives, tracking string and
+    escape state so braces inside task descriptions are not mistaken for structure
+    """
+
+    # Nesting of an object that sits directly inside the top-level object's array
+    _TASK_DEPTH = ['{', '[']
+    _TOP_LEVEL = ['{']
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._pending = ""  # Text of the task object currently being read
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        # Last string read directly in the top-level object; the key of any array that follows
+        self._key_chars: Optional[List[str]] = None
+        self._last_key = ""
+        self._in_tasks = False  # Inside the top-level "tasks" array
+        self.failed = False
+
+    @property
+    def text(self) -> str:
+        """Full response received so far"""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[dict]:
+        """Consume a chunk and return any task objects it completed"""
+        self._chunks.append(chunk)
+        completed = []
+        start = 0 if self._pending else None
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        self._last_key = "".join(self._key_chars)
+                        self._key_chars = None
+                    continue
+                if self._key_chars is not None:
+                    self._key_chars.append(char)
+            elif char == '"':
+                self._in_string = True
+                if self._stack == self._TOP_LEVEL:
+                    self._key_chars = []
+            elif char in '{[':
+                if char == '[' and self._stack == self._TOP_LEVEL:
+                    self._in_tasks = self._last_key == "tasks"
+                elif char == '{' and self._in_tasks and self._stack == self._TASK_DEPTH:
+                    start = i
+                self._stack.append(char)
+            elif char in '}]':
+                if self._stack:
+                    self._stack.pop()
+                if char == '}' and start is not None and self._stack == self._TASK_DEPTH:
+                    completed.append(self._decode(self._pending + chunk[start:i + 1]))
+                    self._pending = ""
+                    start = None
+
+        if start is not None:
+            self._pending += chunk[start:]
+
+        return [task for task in completed if task is not None]
+
+    def _decode(self, text: str) -> Optional[dict]:
+        try:
+            return parse_llm_json(text)
+        except ValueError:
+            # Leave the whole response to the batch parser
+            self.failed = True
+            return None
+
+
+# AgentTask fields stored per task in a cached plan
+_CACHED_TASK_FIELDS = frozenset({"name", "description", "document"})
+
+
+class _PlanCache:
+    """
+    LRU cache of initial plans keyed by query and document set, with optional disk tier
+    Entries hold only task name/description/document so hits always get fresh task ids
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, path: Optional[str] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        if self.path:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(query: str, documents: Optional[List[Document]]) -> str:
+        """Hash the normalized query together with a fingerprint of the documents"""
+        fingerprint = "|".join(sorted(
+            f"{doc.id}:{doc.page_count}:{doc.created_at.isoformat()}" for doc in documents or []
+        ))
+        return hashlib.sha256(f"{query.strip().lower()}|{fingerprint}".encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[List[Dict[str, str]]]:
+        """Return cached task specs, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            if not self.path:
+                return None
+            # File read and JSON decode run off the event loop
+            entry = await asyncio.get_running_loop().run_in_executor(None, self._read_disk, key)
+            if entry is None:
+                return None
+            self._remember(key, entry)
+
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry["tasks"]
+
+    async def put(self, key: str, plan: TaskPlan):
+        """Store the task specs of a freshly created plan"""
+        entry = {
+            "created_at": time.time(),
+            "tasks": [
+                {"name": task.name, "description": task.description, "document": task.document}
+                for task in plan.tasks
+            ]
+        }
+        self._remember(key, entry)
+        if self.path:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_disk, key, entry)
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        entry_path = self.path / f"{key}.json"
+        try:
+            with open(entry_path, 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable plan cache entry {key}: {e}")
+            return None
+        except ValueError as e:
+            entry = None
+            logger.warning(f"Discarding corrupt plan cache entry {key}: {e}")
+
+        if entry is not None and not self._is_valid_entry(entry):
+            entry = None
+            logger.warning(f"Discarding malformed plan cache entry {key}")
+
+        if entry is None:
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+        return entry
+
+    @staticmethod
+    def _is_valid_entry(entry: Any) -> bool:
+        if not isinstance(entry, dict):
+            return False
+        if not isinstance(entry.get("created_at"), (int, float)):
+            return False
+        tasks = entry.get("tasks")
+        return isinstance(tasks, list) and all(
+            isinstance(task, dict) and set(task) <= _CACHED_TASK_FIELDS
+            and isinstance(task.get("name"), str)
+            and isinstance(task.get("description"), str)
+            for task in tasks
+        )
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]):
+        try:
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self.path / f"{key}.json")
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist plan cache entry {key}: {e}")
+
 
 class TaskPlanner:
     """
@@ -28,8 +253,20 @@ class TaskPlanner:
     Key feature: Agent can add/remove/modify tasks based on what it learns
     """
 
-    def __init__(self, provider: BaseProvider):
+    def __init__(self, provider: BaseProvider, config: Optional[DocPixieConfig] = None):
         self.provider = provider
+        # Task ids only need to be unique within a plan, so a counter avoids an
+        # entropy read per task and gives the model short ids to refer back to
+        self._task_ids = itertools.count(1)
+        self._structured_outputs = config is None or config.structured_outputs
+        self._max_findings_tokens = config.max_findings_tokens if config is not None else None
+        self._plan_cache = None
+        if config is not None and config.plan_cache_enabled:
+            self._plan_cache = _PlanCache(
+                max_size=config.plan_cache_size,
+                ttl_seconds=config.plan_cache_ttl_seconds,
+                path=config.plan_cache_path
+            )
 
     async def create_initial_plan(
         self,
@@ -52,40 +289,48 @@ class TaskPlanner:
         try:
             logger.info(f"Creating initial task plan for query: {query[:50]}...")
 
+            cache_key = None
+            if self._plan_cache is not None:
+                cache_key = _PlanCache.make_key(query, documents)
+                cached_tasks = await self._plan_cache.get(cache_key)
+                if cached_tasks is not None:
+                    logger.info(f"Reusing cached plan with {len(cached_tasks)} tasks")
+                    return TaskPlan(
+                        initial_query=query,
+                        tasks=[AgentTask(id=self._next_task_id(), **task_data) for task_data in cached_tasks]
+                    )
+
             # Build context about available documents with full summaries
-            documents_text = ""
-            if documents:
-                doc_list = []
-                for doc in documents:
-                    summary = doc.summary or f"Document with {len(doc.pages)} pages"
-                    doc_list.append(f"{doc.id}: {doc.name}\nSummary: {summary}")
-                documents_text = "\n\n".join(doc_list)
-            else:
-                documents_text = "No documents available"
+            documents_text = await self._build_documents_text(documents)
 
             # Generate initial plan
-            prompt = ADAPTIVE_INITIAL_PLANNING_PROMPT.format(
+            prompt = _render_initial_planning_prompt(
                 query=query,
                 documents=documents_text
             )
 
             messages = [
-                {"role": "system", "content": SYSTEM_ADAPTIVE_PLANNER},
+                _PLANNER_SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ]
 
-            result = await self.provider.process_text_messages(
-                messages=messages,
-                max_tokens=8192,
-                temperature=0.3
-            )
+            result, streamed_tasks = await self._stream_initial_plan(messages)
 
-            # Parse and create task plan
-            task_plan = self._parse_initial_plan(result, query, documents)
+            # Parse and create task plan (tasks already decoded while streaming, if possible)
+            if streamed_tasks:
+                task_plan = self._build_initial_plan(
+                    [TaskSpec.from_dict(task_data) for task_data in streamed_tasks], query, documents
+                )
+            else:
+                task_plan = self._parse_initial_plan(result, query, documents)
+
+            if cache_key is not None and task_plan.tasks:
+                await self._plan_cache.put(cache_key, task_plan)
 
             logger.info(f"Created initial plan with {len(task_plan.tasks)} tasks")
-            for task in task_plan.tasks:
-                logger.debug(f"Task: {task.name} - Document: {task.document}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for task in task_plan.tasks:
+                    logger.debug("Task: %s - Document: %s", task.name, task.document)
 
             return task_plan
 
@@ -113,6 +358,12 @@ class TaskPlanner:
         Returns:
             Updated task plan (may have added/removed/modified tasks)
         """
+        # Nothing left to re-plan: skip the LLM round trip entirely
+        if not current_plan.has_pending_tasks():
+            logger.info("No pending tasks left, skipping plan update")
+            current_plan.current_iteration += 1
+            return current_plan
+
         result = None
         try:
             logger.info(f"Updating task plan after completing: {latest_result.task.name}")
@@ -124,36 +375,41 @@ class TaskPlanner:
             progress_summary = self._build_progress_summary(current_plan, latest_result)
 
             # Build available documents text with full summaries
-            available_documents = ""
-            if documents:
-                doc_list = []
-                for doc in documents:
-                    summary = doc.summary or f"Document with {len(doc.pages)} pages"
-                    doc_list.append(f"{doc.id}: {doc.name}\nSummary: {summary}")
-                available_documents = "\n\n".join(doc_list)
-            else:
-                available_documents = "No documents available"
+            available_documents = await self._build_documents_text(documents)
 
             # Ask agent to evaluate and update plan
-            prompt = ADAPTIVE_PLAN_UPDATE_PROMPT.format(
+            prompt = _render_plan_update_prompt(
                 original_query=original_query,
                 available_documents=available_documents,
                 current_plan_status=plan_status,
                 completed_task_name=latest_result.task.name,
-                task_findings=latest_result.analysis,
+                task_findings=self._build_task_findings(latest_result),
                 progress_summary=progress_summary
             )
 
             messages = [
-                {"role": "system", "content": SYSTEM_ADAPTIVE_PLANNER},
+                _PLANNER_SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ]
 
-            result = await self.provider.process_text_messages(
-                messages=messages,
-                max_tokens=8192,
-                temperature=0.3
-            )
+            json_schema = self._json_schema(ADAPTIVE_PLAN_UPDATE_SCHEMA)
+            try:
+                result = await self.provider.process_text_messages(
+                    messages=messages,
+                    max_tokens=8192,
+                    temperature=0.3,
+                    json_schema=json_schema
+                )
+            except Exception as e:
+                if json_schema is None:
+                    raise
+                # Plain retry: covers models that reject structured output requests
+                logger.warning(f"Plan update with JSON schema failed, retrying without it: {e}")
+                result = await self.provider.process_text_messages(
+                    messages=messages,
+                    max_tokens=8192,
+                    temperature=0.3
+                )
 
             # Apply plan updates
             updated_plan = self._apply_plan_updates(current_plan, result, latest_result)
@@ -165,45 +421,108 @@ class TaskPlanner:
             logger.error(f"Failed to update plan: {e}")
             raise TaskPlanningError(f"Failed to update task plan: {e}. \nRaw response: \n{result}")
 
+    def _json_schema(self, schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return schema if self._structured_outputs else None
+
+    def _next_task_id(self) -> str:
+        return f"task_{next(self._task_ids)}"
+
+    async def _build_documents_text(self, documents: Optional[List[Document]]) -> str:
+        """Build the available-documents prompt section, offloading large lists to a thread"""
+        if documents and len(documents) > _DOCUMENTS_TEXT_OFFLOAD_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._format_documents, documents
+            )
+        return self._format_documents(documents)
+
+    def _format_documents(self, documents: Optional[List[Document]]) -> str:
+        """Format document ids, names and summaries for planning prompts"""
+        if not documents:
+            return "No documents available"
+
+        return "\n\n".join(
+            f"{doc.id}: {doc.name}\nSummary: {doc.summary or f'Document with {len(doc.pages)} pages'}"
+            for doc in documents
+        )
+
+    async def _stream_initial_plan(self, messages: List[dict]) -> Tuple[str, List[dict]]:
+        """
+        Stream the planning response, decoding each task object as soon as it closes
+
+        Returns the full response text and the decoded task dicts. The task list is
+        empty when incremental parsing was not possible, so callers batch-parse instead.
+        """
+        parser = _StreamingTaskParser()
+        streamed_tasks = []
+        try:
+            async for chunk in self.provider.process_text_messages_stream(
+                messages=messages,
+                max_tokens=8192,
+                temperature=0.3,
+                json_schema=self._json_schema(ADAPTIVE_INITIAL_PLAN_SCHEMA)
+            ):
+                streamed_tasks.extend(parser.feed(chunk))
+        except Exception as e:
+            # Plain retry: also covers models that reject structured output requests
+            logger.warning(f"Plan stream aborted, retrying without streaming: {e}")
+            result = await self.provider.process_text_messages(
+                messages=messages,
+                max_tokens=8192,
+                temperature=0.3
+            )
+            return result, []
+
+        if parser.failed:
+            return parser.text, []
+        return parser.text, streamed_tasks
+
     def _parse_initial_plan(self, result: str, query: str, documents: Optional[List[Document]] = None) -> TaskPlan:
         """Parse initial planning response and create TaskPlan with document assignments"""
         try:
-            plan_data = json.loads(sanitize_llm_json(result))
-            tasks = []
-
-            # Create map of available document IDs for validation
-            valid_doc_ids = set()
-            if documents:
-                valid_doc_ids = {doc.id for doc in documents}
-
-            for task_data in plan_data.get("tasks", []):
-                # Parse and validate single document assignment
-                assigned_doc = task_data.get("document", "")
-                valid_assigned_doc = assigned_doc if assigned_doc in valid_doc_ids else ""
-
-                task = AgentTask(
-                    id=str(uuid.uuid4()),
-                    name=task_data.get("name", "Unnamed Task"),
-                    description=task_data.get("description", ""),
-                    document=valid_assigned_doc,
-                    status=TaskStatus.PENDING
-                )
-                tasks.append(task)
+            plan_response = InitialPlanResponse.from_dict(parse_llm_json(result))
+            return self._build_initial_plan(plan_response.tasks, query, documents)
 
-            # Limit to reasonable number of initial tasks
-            if len(tasks) > 4:
-                tasks = tasks[:4]
-                logger.debug("Limited initial tasks to 4")
+        except ValueError as e:
+            logger.error(f"Failed to parse initial plan: {e}")
+            raise TaskPlanningError(f"Failed to parse task plan JSON: {e}, Raw response: {result}")
 
-            return TaskPlan(
-                initial_query=query,
-                tasks=tasks,
-                current_iteration=0
+    def _build_initial_plan(
+        self,
+        task_specs: List[TaskSpec],
+        query: str,
+        documents: Optional[List[Document]] = None
+    ) -> TaskPlan:
+        """Create TaskPlan from parsed task specs, validating document assignments"""
+        tasks = []
+
+        # Create map of available document IDs for validation
+        valid_doc_ids = set()
+        if documents:
+            valid_doc_ids = {doc.id for doc in documents}
+
+        for spec in task_specs:
+            # Validate single document assignment
+            valid_assigned_doc = spec.document if spec.document in valid_doc_ids else ""
+
+            task = AgentTask(
+                id=self._next_task_id(),
+                name=spec.name,
+                description=spec.description,
+                document=valid_assigned_doc,
+                status=TaskStatus.PENDING
             )
+            tasks.append(task)
 
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Failed to parse initial plan: {e}")
-            raise TaskPlanningError(f"Failed to parse task plan JSON: {e}, Raw response: {result}")
+        # Limit to reasonable number of initial tasks
+        if len(tasks) > 4:
+            tasks = tasks[:4]
+            logger.debug("Limited initial tasks to 4")
+
+        return TaskPlan(
+            initial_query=query,
+            tasks=tasks,
+            current_iteration=0
+        )
 
     def _apply_plan_updates(
         self,
@@ -213,74 +532,70 @@ class TaskPlanner:
     ) -> TaskPlan:
         """Apply updates to the current plan based on agent's decision"""
         try:
-            update_data = json.loads(sanitize_llm_json(update_result))
-            action = update_data.get("action", "continue")
-            reason = update_data.get("reason", "No reason provided")
+            update = PlanUpdateResponse.from_dict(parse_llm_json(update_result))
 
-            logger.debug(f"Plan update action: {action} - {reason}")
+            logger.debug(
+                "Plan update: +%d -%d ~%d - %s",
+                len(update.add), len(update.remove), len(update.modify), update.reason
+            )
 
-            if action == "continue":
+            if not update.has_changes:
                 # No changes needed
                 logger.info("Continuing with current plan unchanged")
 
-            elif action == "add_tasks":
-                # Add new tasks
-                new_tasks_data = update_data.get("new_tasks", [])
-                for task_data in new_tasks_data:
-                    assigned_doc = task_data.get("document", "")
-                    new_task = AgentTask(
-                        name=task_data.get("name", "New Task"),
-                        description=task_data.get("description", ""),
-                        document=assigned_doc,
-                        status=TaskStatus.PENDING
+            # Remove specified tasks
+            for task_id in update.remove:
+                if current_plan.remove_task(task_id):
+                    logger.info(f"Removed task: {task_id}")
+
+            # Modify existing tasks
+            for modification in update.modify:
+                task = current_plan.get_task(modification.task_id)
+                if task and task.status == TaskStatus.PENDING:
+                    old_name = task.name
+                    old_doc = task.document
+                    current_plan.update_task(
+                        modification.task_id,
+                        name=modification.new_name,
+                        description=modification.new_description,
+                        document=modification.new_document
                     )
-                    current_plan.add_task(new_task)
-                    logger.info(f"Added new task: {new_task.name} - Document: {assigned_doc}")
-
-            elif action == "remove_tasks":
-                # Remove specified tasks
-                task_ids_to_remove = update_data.get("tasks_to_remove", [])
-                for task_id in task_ids_to_remove:
-                    if current_plan.remove_task(task_id):
-                        logger.info(f"Removed task: {task_id}")
-
-            elif action == "modify_tasks":
-                # Modify existing tasks
-                modifications = update_data.get("modified_tasks", [])
-                for modification in modifications:
-                    task_id = modification.get("task_id")
-                    task = next((t for t in current_plan.tasks if t.id == task_id), None)
-                    if task and task.status == TaskStatus.PENDING:
-                        old_name = task.name
-                        old_doc = task.document
-                        task.name = modification.get("new_name", task.name)
-                        task.description = modification.get("new_description", task.description)
-                        task.document = modification.get("new_document", task.document)
-                        logger.info(f"Modified task '{old_name}' -> '{task.name}' (Document: {old_doc} -> {task.document})")
+                    logger.info(f"Modified task '{old_name}' -> '{task.name}' (Document: {old_doc} -> {task.document})")
+
+            # Add new tasks
+            for spec in update.add:
+                new_task = AgentTask(
+                    id=self._next_task_id(),
+                    name=spec.name,
+                    description=spec.description,
+                    document=spec.document,
+                    status=TaskStatus.PENDING
+                )
+                current_plan.add_task(new_task)
+                logger.info(f"Added new task: {new_task.name} - Document: {spec.document}")
 
             current_plan.current_iteration += 1
             return current_plan
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except ValueError as e:
             logger.error(f"Failed to parse plan updates: {e}")
             raise TaskPlanningError(f"Failed to parse plan update JSON: {e}")
 
+    def _build_task_findings(self, latest_result: TaskResult) -> str:
+        """Bound the findings by tokens so update prompts stay a predictable size"""
+        if self._max_findings_tokens is None:
+            return latest_result.analysis
+        return truncate_to_tokens(latest_result.analysis, self._max_findings_tokens)
+
     def _build_plan_status(self, plan: TaskPlan) -> str:
         """Build text summary of current plan status"""
-        status_lines = []
-        for task in plan.tasks:
-            status_lines.append(f"- {task.name}: {task.status.value}")
-        return "\n".join(status_lines)
+        return plan.get_status_text()
 
     def _build_progress_summary(self, plan: TaskPlan, latest_result: TaskResult) -> str:
         """Build summary of progress so far"""
-        completed_tasks = plan.get_completed_tasks()
+        progress_text = plan.get_progress_text()
 
-        if not completed_tasks:
+        if not progress_text:
             return f"Just completed first task: {latest_result.task.name}"
 
-        summary_parts = []
-        for task in completed_tasks:
-            summary_parts.append(f"✓ {task.name}")
-
-        return "Completed tasks:\n" + "\n".join(summary_parts)
+        return "Completed tasks:\n" + progress_text
@@ -4,16 +4,19 @@ DocPixie Textual CLI - Modern terminal interface for document chat
 """
 
 import asyncio
-from typing import Optional, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Tuple
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer, Input, Static, Label, TextArea
 from textual.screen import Screen
-import pyfiglet
-
-from docpixie import DocPixie
+from textual.reactive import var
+from textual.timer import Timer
+from rich.panel import Panel
+from rich.align import Align
+from rich.text import Text
 
 from .config import get_config_manager
 from .state_manager import AppStateManager
@@ -24,29 +27,124 @@ from .event_handlers import (
     CommandEventMixin, ConversationEventMixin,
     ModelEventMixin, DocumentEventMixin
 )
-from .styles import SETUP_SCREEN_CSS, MAIN_APP_CSS
 from .widgets import (
     CommandPalette, ChatArea
 )
 
+if TYPE_CHECKING:
+    from docpixie import DocPixie
+    from docpixie.models.document import Document
+
+
+# Pink-forward gradient (deep → light) for the welcome banner
+WELCOME_GRADIENT = [
+    "#ff4da6",  # deep pink
+    "#ff66b3",
+    "#ff80bf",
+    "#ff99cc",  # brand pink
+    "#ffb3d9",
+    "#ffcce6"   # light pink
+]
+
+
+@lru_cache(maxsize=1)
+def _build_ascii_art() -> Text:
+    """Render the colorful DocPixie banner using pyfiglet (built once, on first use)"""
+    import pyfiglet
+
+    ascii_art = Text()
+    figlet_text = pyfiglet.figlet_format("DocPixie CLI", font="big")
+    styles = [color + " bold" for color in WELCOME_GRADIENT]
+    last_index = len(styles) - 1
+    column_styles: Dict[int, List[str]] = {}
+
+    for line in figlet_text.split("\n"):
+        if not line.strip():
+            continue
+
+        # Gradient style per column, shared by all lines of the same width
+        width = len(line)
+        line_styles = column_styles.get(width)
+        if line_styles is None:
+            line_styles = [styles[(i * last_index) // max(width - 1, 1)] for i in range(width)]
+            column_styles[width] = line_styles
+
+        # Append runs of characters that share a style rather than one char at a time
+        run_start, run_style = 0, None
+        for i, char in enumerate(line):
+            style = line_styles[i] if char != " " else None
+            if style != run_style:
+                if i > run_start:
+                    ascii_art.append(line[run_start:i], style=run_style)
+                run_start, run_style = i, style
+        ascii_art.append(line[run_start:], style=run_style)
+        ascii_art.append("\n")
+
+    return ascii_art
+
+
+def _build_welcome_panel(doc_count: int) -> Panel:
+    """Assemble the welcome panel for the given number of indexed documents"""
+    welcome_content = Text()
+    welcome_content.append("\n")
+    welcome_content.append(_build_ascii_art())
+    welcome_content.append("\n\n")
+
+    if doc_count:
+        welcome_content.append(f"{doc_count} document(s) indexed and ready!\n\n", style="bold green")
+    else:
+        welcome_content.append("No documents indexed yet\n", style="yellow")
+        welcome_content.append("Add PDFs to ./documents and type ", style="dim")
+        welcome_content.append(" to get started\n\n", style="dim")
+
+    welcome_content.append("Start chatting with your documents or type ", style="white")
+    welcome_content.append("/", style="bold cyan")
+    welcome_content.append(" to see all commands", style="white")
+
+    return Panel(
+        Align.center(welcome_content),
+        title="[bold #ff99cc]DocPixie[/]",
+        border_style="#ff99cc",
+        padding=(1, 2),
+        expand=False
+    )
+
+
+# Key bindings are fixed, so share one immutable tuple per class
+_CHAT_INPUT_BINDINGS = (
+    Binding("ctrl+d", "show_documents", "Documents", priority=True),
+    Binding("ctrl+/", "toggle_palette", "Commands", priority=True),
+    Binding("shift+enter", "add_newline", "New line", priority=True),
+    Binding("ctrl+j", "add_newline", "New line", priority=True),
+    Binding("meta+enter", "add_newline", "New line", priority=True),
+    Binding("enter", "submit_message", "Submit", priority=True),
+)
+
+_APP_BINDINGS = (
+    Binding("ctrl+n", "new_conversation", "New Conversation"),
+    Binding("ctrl+l", "show_conversations", "Conversations"),
+    Binding("ctrl+o", "show_models", "Model Config"),
+    Binding("ctrl+d", "show_documents", "Documents"),
+    Binding("ctrl+slash", "toggle_palette", "Commands"),
+    Binding("ctrl+q", "quit", "Quit"),
+)
+
 
 class ChatInput(TextArea):
     """Custom TextArea for chat input with Enter to submit"""
 
-    BINDINGS = [
-        Binding("ctrl+d", "show_documents", "Documents", priority=True),
-        Binding("ctrl+/", "toggle_palette", "Commands", priority=True),
-        Binding("shift+enter", "add_newline", "New line", priority=True),
-        Binding("ctrl+j", "add_newline", "New line", priority=True),
-        Binding("meta+enter", "add_newline", "New line", priority=True),
-        Binding("enter", "submit_message", "Submit", priority=True),
-    ]
+    BINDINGS = _CHAT_INPUT_BINDINGS
 
     def action_submit_message(self) -> None:
         """Submit on Enter"""
         app = self.app
         if hasattr(app, 'submit_chat_message'):
-            asyncio.create_task(app.submit_chat_message())
+            # Keep a reference to the task and ignore Enter while one is in flight
+            submit_task = getattr(app, '_submit_task', None)
+            if submit_task is not None and not submit_task.done():
+                return
+            app._submit_task = asyncio.create_task(app.submit_chat_message())
+            app._submit_task.add_done_callback(lambda _task: setattr(app, '_submit_task', None))
 
     def action_add_newline(self) -> None:
         """Add a newline on Shift+Enter"""
@@ -74,7 +172,7 @@ class ChatInput(TextArea):
 class SetupScreen(Screen):
     """First-time setup screen for API key configuration"""
 
-    CSS = SETUP_SCREEN_CSS
+    CSS_PATH = "setup_screen.tcss"
     BINDINGS = [
         Binding("escape", "quit_if_empty", "Quit"),
     ]
@@ -149,25 +247,29 @@ class DocPixieTUI(
 ):
     """Main DocPixie Terminal UI Application"""
 
-    CSS = MAIN_APP_CSS
+    CSS_PATH = "app.tcss"
 
-    BINDINGS = [
-        ("ctrl+n", "new_conversation", "New Conversation"),
-        ("ctrl+l", "show_conversations", "Conversations"),
-        ("ctrl+o", "show_models", "Model Config"),
-        ("ctrl+d", "show_documents", "Documents"),
-        ("ctrl+slash", "toggle_palette", "Commands"),
-        ("ctrl+q", "quit", "Quit"),
-    ]
+    BINDINGS = _APP_BINDINGS
+
+    # Mirrors the status bar; the watcher only fires when the text changes
+    status_text = var("", init=False)
 
     def __init__(self):
         super().__init__()
-        self.docpixie: Optional[DocPixie] = None
+        self.docpixie: Optional['DocPixie'] = None
         self.state_manager = AppStateManager()
         self.config_manager = get_config_manager()
         self.command_handler = CommandHandler(self, self.state_manager)
         self.docpixie_manager = DocPixieManager(self, self.state_manager)
         self.task_display_manager = TaskDisplayManager(self, self.state_manager)
+        self._palette_debounce: Optional[Timer] = None
+        self._last_palette_key: Optional[Tuple[str, bool]] = None
+        self._submit_task: Optional[asyncio.Task] = None
+        self._task_events: Optional[asyncio.Queue] = None
+        self._task_event_drain: Optional[asyncio.Task] = None
+        self._indexed_queue: List['Document'] = []
+        self._indexed_flush: Optional[Timer] = None
+        self._welcome_panels: Dict[int, Panel] = {}
 
     def compose(self) -> ComposeResult:
         """Create the main UI layout"""
@@ -200,14 +302,29 @@ class DocPixieTUI(
 
     async def on_mount(self) -> None:
         """Initialize the app when mounted"""
+        # Widgets that handlers touch on nearly every event; look them up once
+        self._chat_log = self.query_one("#chat-log", ChatArea)
+        self._status_label = self.query_one("#status-label", Label)
+        self._input_hint = self.query_one("#input-hint", Label)
+        self._chat_input = self.query_one("#chat-input", ChatInput)
+        self._palette = self.query_one("#command-palette", CommandPalette)
+
+        # Task updates from the query worker thread are funnelled through here
+        self._task_events = asyncio.Queue()
+        self._task_event_drain = asyncio.create_task(self._drain_task_events())
+
         self.set_timer(0.1, self.deferred_init)
         try:
             self.call_after_refresh(
-                lambda: self.query_one("#chat-input", ChatInput).focus()
+                lambda: self._chat_input.focus()
             )
         except Exception:
             pass
 
+    def on_unmount(self) -> None:
+        """Release worker threads owned by the managers"""
+        self.docpixie_manager.shutdown()
+
     async def deferred_init(self) -> None:
         """Deferred initialization to allow UI to render"""
         if not self.config_manager.has_api_key():
@@ -222,122 +339,73 @@ class DocPixieTUI(
 
     def show_welcome_message(self) -> None:
         """Display welcome message and instructions"""
-        chat_log = self.query_one("#chat-log", ChatArea)
-
-        from rich.panel import Panel
-        from rich.align import Align
-        from rich.text import Text
-
-        # Create colorful ASCII art using pyfiglet
-        ascii_art = Text()
-        figlet_text = pyfiglet.figlet_format("DocPixie CLI", font="big")
-
-        # Define a pink-forward gradient (deep → light)
-        colors = [
-            "#ff4da6",  # deep pink
-            "#ff66b3",
-            "#ff80bf",
-            "#ff99cc",  # brand pink
-            "#ffb3d9",
-            "#ffcce6"   # light pink
-        ]
-
-        lines = figlet_text.split("\n")
-        for line in lines:
-            if line.strip():
-                colored_line = Text()
-                chars = list(line)
-                for i, char in enumerate(chars):
-                    if char != " " and char != "\n":
-                        color_index = (i * (len(colors) - 1)) // max(len(chars) - 1, 1)
-                        colored_line.append(char, style=colors[color_index] + " bold")
-                    else:
-                        colored_line.append(char)
-                ascii_art.append(colored_line)
-                ascii_art.append("\n")
-
-        welcome_content = Text()
-        welcome_content.append("\n")
-        welcome_content.append(ascii_art)
-        welcome_content.append("\n\n")
-
-        if self.state_manager.indexed_documents:
-            welcome_content.append(f"{len(self.state_manager.indexed_documents)} document(s) indexed and ready!\n\n", style="bold green")
-        else:
-            welcome_content.append("No documents indexed yet\n", style="yellow")
-            welcome_content.append("Add PDFs to ./documents and type ", style="dim")
-            welcome_content.append(" to get started\n\n", style="dim")
-
-        welcome_content.append("Start chatting with your documents or type ", style="white")
-        welcome_content.append("/", style="bold cyan")
-        welcome_content.append(" to see all commands", style="white")
+        chat_log = self._chat_log
 
-        panel = Panel(
-            Align.center(welcome_content),
-            title="[bold #ff99cc]DocPixie[/]",
-            border_style="#ff99cc",
-            padding=(1, 2),
-            expand=False
-        )
+        doc_count = len(self.state_manager.indexed_documents)
+        panel = self._welcome_panels.get(doc_count)
+        if panel is None:
+            panel = _build_welcome_panel(doc_count)
+            self._welcome_panels[doc_count] = panel
 
-        chat_log.write(panel)
-        chat_log.add_static_text("\n")
+        with self.batch_update():
+            chat_log.write(panel)
+            chat_log.add_static_text("\n")
 
 
     async def submit_chat_message(self) -> None:
         """Submit the chat message from the TextArea"""
         if self.state_manager.command_palette_active:
-            command_palette = self.query_one("#command-palette", CommandPalette)
+            command_palette = self._palette
             selected_command = command_palette.select_current_command()
             if selected_command:
                 command_palette.hide()
                 self.state_manager.command_palette_active = False
-                text_area = self.query_one("#chat-input", ChatInput)
-                text_area.clear()
+                self._clear_chat_input()
                 await self.handle_command(selected_command)
             return
 
-        text_area = self.query_one("#chat-input", ChatInput)
+        text_area = self._chat_input
         user_input = text_area.text.strip()
 
         if user_input:
-            text_area.clear()
+            self._clear_chat_input()
             await self.submit_text(user_input)
 
+    def _clear_chat_input(self) -> None:
+        """Clear the chat input and forget the last palette filter state"""
+        self._chat_input.clear()
+        self._last_palette_key = None
+
 
     async def submit_text(self, user_input: str) -> None:
         """Handle text submission from TextArea"""
         if self.state_manager.processing:
             return
 
-        chat_log = self.query_one("#chat-log", ChatArea)
-
         if not user_input:
             return
 
         if self.state_manager.command_palette_active:
-            command_palette = self.query_one("#command-palette", CommandPalette)
+            command_palette = self._palette
             command_palette.hide()
             self.state_manager.command_palette_active = False
 
         if user_input.startswith("/"):
-            await self.handle_command(user_input.lower())
+            # Commands are case-insensitive; arguments keep their case
+            cmd, sep, rest = user_input.partition(" ")
+            await self.handle_command(cmd.lower() + sep + rest)
             return
 
-        chat_log.add_user_message(user_input)
+        self._chat_log.add_user_message(user_input)
 
         self.set_chat_input_enabled(False)
         try:
+            loop = asyncio.get_running_loop()
+            put_event = self._task_events.put_nowait
+
             async def task_callback(event_type: str, data: Any):
-                def _update():
-                    try:
-                        self.task_display_manager.display_task_update(event_type, data)
-                    except Exception:
-                        pass
-                try:
-                    self.call_from_thread(_update)
-                except Exception:
-                    _update()
+                # Runs on the worker thread: hand the event over without waiting
+                loop.call_soon_threadsafe(put_event, (event_type, data))
 
             await self.docpixie_manager.process_query(user_input, task_callback)
         finally:
@@ -345,11 +413,8 @@ class DocPixieTUI(
 
     def set_chat_input_enabled(self, enabled: bool) -> None:
         """Enable or disable the chat input and update hint text."""
-        try:
-            text_area = self.query_one("#chat-input", ChatInput)
-            hint = self.query_one("#input-hint", Label)
-        except Exception:
-            return
+        text_area = self._chat_input
+        hint = self._input_hint
 
         try:
             text_area.disabled = not enabled
@@ -368,6 +433,34 @@ class DocPixieTUI(
         else:
             hint.update("⏳ Agent is working… input disabled until response.")
 
+    async def _drain_task_events(self) -> None:
+        """Display task updates queued by the query worker, a batch at a time"""
+        queue = self._task_events
+        display = self.task_display_manager.display_task_update
+        while True:
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            with self.batch_update():
+                for event_type, data in events:
+                    try:
+                        display(event_type, data)
+                    except Exception:
+                        pass
+
+    @property
+    def chat_log(self) -> ChatArea:
+        """The main chat area, looked up once on mount"""
+        return self._chat_log
+
+    def refresh_status(self) -> None:
+        """Recompute the status bar text from the current state"""
+        self.status_text = self.state_manager.get_status_text()
+
+    def watch_status_text(self, status_text: str) -> None:
+        """Push a changed status bar text to the label"""
+        self._status_label.update(status_text)
+
 
 
 
@@ -381,8 +474,9 @@ class DocPixieTUI(
 
 
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
         """Quit the application"""
+        await self.docpixie_manager.flush_conversation_save()
         self.exit()
 
     def action_new_conversation(self) -> None:
@@ -405,8 +499,8 @@ class DocPixieTUI(
         """Toggle command palette"""
         if self.state_manager.processing:
             return
-        command_palette = self.query_one("#command-palette", CommandPalette)
-        text_area = self.query_one("#chat-input", ChatInput)
+        command_palette = self._palette
+        text_area = self._chat_input
 
         if self.state_manager.command_palette_active:
             command_palette.hide()
@@ -420,6 +514,13 @@ class DocPixieTUI(
 
 def main():
     """Main entry point for Textual CLI"""
+    # uvloop is an optional faster event loop (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     app = DocPixieTUI()
     app.run()
 
@@ -2,18 +2,32 @@
 Command handling for DocPixie CLI
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional
 from pathlib import Path
-from docpixie import DocPixie
 from .state_manager import AppStateManager
-from .widgets import (
-    ConversationManagerDialog, ModelSelectorDialog, DocumentManagerDialog,
-    ChatArea
-)
+from .widgets import ConversationManagerDialog, ModelSelectorDialog, DocumentManagerDialog
 
 if TYPE_CHECKING:
     from .app import DocPixieTUI
 
+HELP_TEXT = (
+    "\n[bold]Available Commands:[/bold]\n"
+    "  /new          - Start a new conversation (Ctrl+N)\n"
+    "  /conversations - Switch between conversations (Ctrl+L)\n"
+    "  /save         - Save current conversation\n"
+    "  /clear        - Clear the chat display\n"
+    "  /model        - Configure AI models (Ctrl+O)\n"
+    "  /documents    - Manage and index documents (Ctrl+D)\n"
+    "  /help         - Show this help message\n"
+    "  /exit         - Exit the program (Ctrl+Q)\n\n"
+    "[dim]Press Ctrl+/ to open command palette[/dim]\n\n"
+)
+
+UNKNOWN_COMMAND_TEMPLATE = (
+    "[warning]Unknown command: {command}[/warning]\n"
+    "Type /help for available commands\n\n"
+)
+
 
 class CommandHandler:
     """Handles all slash commands for the CLI application"""
@@ -21,63 +35,56 @@ class CommandHandler:
     def __init__(self, app: 'DocPixieTUI', state_manager: AppStateManager):
         self.app = app
         self.state_manager = state_manager
+        self._handlers: Dict[str, Callable[[], Awaitable[None]]] = {
+            "/exit": self._handle_exit_command,
+            "/new": self._handle_new_command,
+            "/clear": self._handle_clear_command,
+            "/save": self._handle_save_command,
+            "/conversations": self._handle_conversations_command,
+            "/model": self._handle_model_command,
+            "/documents": self._handle_documents_command,
+            "/help": self._handle_help_command,
+        }
     
     async def handle_command(self, command: str) -> None:
         """Handle slash commands"""
-        chat_log = self.app.query_one("#chat-log", ChatArea)
-        
-        if command == "/exit":
-            self.state_manager.save_current_conversation()
-            self.app.exit()
-        
-        elif command == "/new":
-            await self._handle_new_command(chat_log)
-        
-        elif command == "/clear":
-            self._handle_clear_command(chat_log)
+        handler = self._handlers.get(command)
+        if handler is None:
+            self.app.chat_log.write(UNKNOWN_COMMAND_TEMPLATE.format(command=command))
+            return
         
-        elif command == "/save":
-            self._handle_save_command(chat_log)
-        
-        elif command == "/conversations":
-            await self._handle_conversations_command()
-        
-        elif command == "/model":
-            await self._handle_model_command()
-        
-        elif command == "/documents":
-            await self._handle_documents_command()
-        
-        elif command == "/help":
-            self._handle_help_command(chat_log)
-        
-        else:
-            chat_log.write(f"[warning]Unknown command: {command}[/warning]\n")
-            chat_log.write("Type /help for available commands\n\n")
+        await handler()
+    
+    async def _handle_exit_command(self) -> None:
+        """Handle /exit command"""
+        await self.state_manager.save_current_conversation_async()
+        self.app.exit()
     
-    async def _handle_new_command(self, chat_log: ChatArea) -> None:
+    async def _handle_new_command(self) -> None:
         """Handle /new command"""
-        self.state_manager.save_current_conversation()
-        self.state_manager.create_new_conversation()
+        chat_log = self.app.chat_log
+        await self.state_manager.save_current_conversation_async()
+        await self.state_manager.create_new_conversation_async()
         self.state_manager.clear_task_plan()
         
         chat_log.clear()
         self.app.show_welcome_message()
         chat_log.write("[green bold]●[/green bold] Started new conversation\n\n")
         
-        status_label = self.app.query_one("#status-label")
-        status_label.update(self.state_manager.get_status_text())
+        self.app.refresh_status()
     
-    def _handle_clear_command(self, chat_log: ChatArea) -> None:
+    async def _handle_clear_command(self) -> None:
         """Handle /clear command"""
+        chat_log = self.app.chat_log
         self.state_manager.clear_task_plan()
         chat_log.clear()
         self.app.show_welcome_message()
     
-    def _handle_save_command(self, chat_log: ChatArea) -> None:
+    async def _handle_save_command(self) -> None:
         """Handle /save command"""
+        chat_log = self.app.chat_log
         if self.state_manager.current_conversation_id and self.state_manager.conversation_history:
-            self.state_manager.save_current_conversation()
+            await self.state_manager.save_current_conversation_async()
             chat_log.write("[green bold]●[/green bold] Conversation saved!\n\n")
         else:
             chat_log.write("[warning]No conversation to save[/warning]\n\n")
@@ -85,7 +92,8 @@ class CommandHandler:
     async def _handle_conversations_command(self) -> None:
         """Handle /conversations command"""
         await self.app.push_screen(ConversationManagerDialog(
-            self.state_manager.current_conversation_id
+            self.state_manager.current_conversation_id,
+            self.state_manager.conversation_storage
         ))
     
     async def _handle_model_command(self) -> None:
@@ -99,15 +107,6 @@ class CommandHandler:
             self.app.docpixie
         ))
     
-    def _handle_help_command(self, chat_log: ChatArea) -> None:
+    async def _handle_help_command(self) -> None:
         """Handle /help command"""
-        chat_log.write("\n[bold]Available Commands:[/bold]\n")
-        chat_log.write("  /new          - Start a new conversation (Ctrl+N)\n")
-        chat_log.write("  /conversations - Switch between conversations (Ctrl+L)\n")
-        chat_log.write("  /save         - Save current conversation\n")
-        chat_log.write("  /clear        - Clear the chat display\n")
-        chat_log.write("  /model        - Configure AI models (Ctrl+O)\n")
-        chat_log.write("  /documents    - Manage and index documents (Ctrl+D)\n")
-        chat_log.write("  /help         - Show this help message\n")
-        chat_log.write("  /exit         - Exit the program (Ctrl+Q)\n\n")
-        chat_log.write("[dim]Press Ctrl+/ to open command palette[/dim]\n\n")
\ No newline at end of file
+        self.app.chat_log.write(HELP_TEXT)
\ No newline at end of file
@@ -5,10 +5,25 @@ Handles API keys, model preferences, and user settings
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, asdict, field
 
+# Use orjson when the 'fast' extra is installed
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
 
 PLANNING_MODELS = [
     "anthropic/claude-opus-4.1",
@@ -75,14 +90,20 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
         self.conversations_dir.mkdir(exist_ok=True)
 
+        # Settings changed from the UI are written by one background worker,
+        # so a later save always lands after an earlier one
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="docpixie-config"
+        )
+
         self.config = self.load_config()
 
     def load_config(self) -> CLIConfig:
         """Load configuration from file or create default"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = _json_loads(f.read())
                     return CLIConfig.from_dict(data)
             except Exception as e:
                 print(f"Warning: Failed to load config: {e}")
@@ -96,9 +117,17 @@ class ConfigManager:
 
     def save_config(self):
         """Save current configuration to file"""
+        self._write_config(self.config.to_dict())
+
+    def save_config_in_background(self):
+        """Save a snapshot of the current configuration without blocking the caller"""
+        self._save_executor.submit(self._write_config, self.config.to_dict())
+
+    def _write_config(self, data: Dict[str, Any]):
+        """Write configuration data to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config.to_dict(), f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(_json_dumps(data))
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -111,7 +140,7 @@ class ConfigManager:
     def set_api_key(self, api_key: str):
         """Set and save OpenRouter API key"""
         self.config.openrouter_api_key = api_key
-        self.save_config()
+        self.save_config_in_background()
 
     def has_api_key(self) -> bool:
         """Check if API key is configured"""
@@ -127,7 +156,7 @@ class ConfigManager:
             self.config.text_model = text_model
         if vision_model:
             self.config.vision_model = vision_model
-        self.save_config()
+        self.save_config_in_background()
 
     def get_conversation_path(self, conversation_id: str) -> Path:
         """Get path for a specific conversation file"""
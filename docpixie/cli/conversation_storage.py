@@ -3,16 +3,44 @@ Local conversation storage for DocPixie CLI
 Stores conversations per project directory
 """
 
+import asyncio
 import json
 import uuid
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 
 from docpixie.models.agent import ConversationMessage
 
+# orjson is optional; when missing, fall back to the stdlib encoder with the
+# same indented layout so files stay readable either way
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_line(data: Any) -> bytes:
+        return orjson.dumps(data) + b"\n"
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _json_line(data: Any) -> bytes:
+        return (json.dumps(data) + "\n").encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# One persistent worker: conversation files and metadata.json are rewritten
+# whole, so disk access must stay serialized across the whole process
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docpixie-conversations")
+
 
 @dataclass
 class ConversationMetadata:
@@ -25,6 +53,19 @@ class ConversationMetadata:
     message_count: int
     indexed_documents: List[str]
     total_cost: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for JSON serialization without deep-copying"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "working_directory": self.working_directory,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "message_count": self.message_count,
+            "indexed_documents": self.indexed_documents,
+            "total_cost": self.total_cost,
+        }
 
 
 class ConversationStorage:
@@ -42,7 +83,21 @@ class ConversationStorage:
         
         self.current_conversation_id: Optional[str] = None
         
-        self._load_metadata()
+        # Shared by every instance so all conversation disk access is serialized
+        self._io_executor = _IO_EXECUTOR
+        
+        # Local conversations keyed by id and newest first; both are dropped
+        # whenever metadata is written
+        self._local_by_id: Optional[Dict[str, ConversationMetadata]] = None
+        self._local_sorted: Optional[List[ConversationMetadata]] = None
+        
+        # Serialized form of each metadata entry, reused while the entry is
+        # the same object; entries are replaced, never modified, on update
+        self._metadata_dicts: Dict[str, Tuple[ConversationMetadata, Dict[str, Any]]] = {}
+        
+        # metadata.json is read once; writers build a new dict and publish it
+        # through _save_metadata, so readers never see one being modified
+        self._metadata: Dict[str, ConversationMetadata] = self._load_metadata()
     
     def _load_metadata(self) -> Dict[str, ConversationMetadata]:
         """Load conversation metadata from file"""
@@ -50,8 +105,8 @@ class ConversationStorage:
             return {}
         
         try:
-            with open(self.metadata_file, 'r') as f:
-                data = json.load(f)
+            with open(self.metadata_file, 'rb') as f:
+                data = _json_loads(f.read())
             
             metadata = {}
             for conv_id, conv_data in data.items():
@@ -65,21 +120,83 @@ class ConversationStorage:
             return {}
     
     def _save_metadata(self, metadata: Dict[str, ConversationMetadata]):
-        """Save conversation metadata to file"""
+        """Make metadata the current index and save it to file"""
+        self._metadata = metadata
+        self._local_by_id = None
+        self._local_sorted = None
         try:
             data = {}
+            dicts = {}
             for conv_id, conv_meta in metadata.items():
-                data[conv_id] = asdict(conv_meta)
+                cached = self._metadata_dicts.get(conv_id)
+                if cached is None or cached[0] is not conv_meta:
+                    cached = (conv_meta, conv_meta.to_dict())
+                dicts[conv_id] = cached
+                data[conv_id] = cached[1]
+            self._metadata_dicts = dicts
             
-            with open(self.metadata_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_json(self.metadata_file, data)
         except Exception as e:
             print(f"Error saving conversation metadata: {e}")
     
+    def _write_json(self, path: Path, data: Any):
+        """Write JSON through a temporary file so a crash never leaves it truncated"""
+        self._write_bytes(path, _json_dumps(data))
+    
+    def _write_bytes(self, path: Path, payload: bytes):
+        """Replace a file's contents atomically"""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    
     def _conversation_file_path(self, conversation_id: str) -> Path:
-        """Get path for conversation file"""
+        """Get path for a legacy single-file conversation"""
         return self.conversations_dir / f"{conversation_id}.json"
     
+    def _meta_file_path(self, conversation_id: str) -> Path:
+        """Get path for a conversation's metadata header"""
+        return self.conversations_dir / f"{conversation_id}.meta.json"
+    
+    def _messages_file_path(self, conversation_id: str) -> Path:
+        """Get path for a conversation's append-only message log"""
+        return self.conversations_dir / f"{conversation_id}.jsonl"
+    
+    def _write_meta_file(self, metadata: ConversationMetadata):
+        """Rewrite the small metadata header of a conversation"""
+        self._write_json(self._meta_file_path(metadata.id), {
+            "id": metadata.id,
+            "metadata": metadata.to_dict()
+        })
+    
+    @staticmethod
+    def _message_to_dict(message: ConversationMessage) -> Dict[str, Any]:
+        """Convert a message to its stored form"""
+        return {
+            "role": message.role,
+            "content": message.content,
+            "timestamp": message.timestamp.isoformat(),
+            "cost": getattr(message, 'cost', 0.0) or 0.0
+        }
+    
+    @staticmethod
+    def _message_from_dict(msg_data: Dict[str, Any]) -> ConversationMessage:
+        """Build a message from its stored form"""
+        return ConversationMessage(
+            role=msg_data["role"],
+            content=msg_data["content"],
+            timestamp=datetime.fromisoformat(msg_data["timestamp"]),
+            cost=msg_data.get("cost", 0.0)
+        )
+    
+    def _read_legacy_messages(self, conversation_id: str) -> List[Dict[str, Any]]:
+        """Stored messages of a legacy single-file conversation, or [] if there is none"""
+        conversation_file = self._conversation_file_path(conversation_id)
+        if not conversation_file.exists():
+            return []
+        with open(conversation_file, 'rb') as f:
+            return _json_loads(f.read())["messages"]
+    
     def _generate_conversation_name(self, messages: List[ConversationMessage]) -> str:
         """Generate a conversation name from the first user message"""
         if not messages:
@@ -115,17 +232,10 @@ class ConversationStorage:
             total_cost=0.0
         )
         
-        conversation_data = {
-            "id": conversation_id,
-            "metadata": asdict(metadata),
-            "messages": []
-        }
-        
-        conversation_file = self._conversation_file_path(conversation_id)
-        with open(conversation_file, 'w') as f:
-            json.dump(conversation_data, f, indent=2)
+        self._write_meta_file(metadata)
+        self._write_bytes(self._messages_file_path(conversation_id), b"")
         
-        all_metadata = self._load_metadata()
+        all_metadata = dict(self._metadata)
         all_metadata[conversation_id] = metadata
         self._save_metadata(all_metadata)
         
@@ -133,35 +243,56 @@ class ConversationStorage:
         return conversation_id
     
     def save_conversation(self, conversation_id: str, messages: List[ConversationMessage], 
-                         indexed_documents: List[str] = None):
-        """Save conversation messages"""
+                         indexed_documents: List[str] = None,
+                         new_count: Optional[int] = None) -> Optional[ConversationMetadata]:
+        """
+        Save conversation messages and return the updated metadata
+        
+        messages may be only the most recent part of the conversation; its
+        last new_count entries (all of them when None) are appended to the log.
+        Messages already on disk are never rewritten.
+        """
         try:
             now = datetime.now().isoformat()
             
-            messages_data = []
-            total_cost = 0.0
-            for msg in messages:
-                msg_dict = {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat()
-                }
-                msg_cost = getattr(msg, 'cost', 0.0) or 0.0
-                msg_dict["cost"] = msg_cost
-                total_cost += msg_cost
-                messages_data.append(msg_dict)
+            if new_count is None or new_count > len(messages):
+                new_count = len(messages)
+            new_messages = messages[len(messages) - new_count:] if new_count > 0 else []
+            
+            lines = [_json_line(self._message_to_dict(msg)) for msg in new_messages]
+            new_cost = sum(getattr(msg, 'cost', 0.0) or 0.0 for msg in new_messages)
+            
+            messages_file = self._messages_file_path(conversation_id)
+            previous = self._metadata.get(conversation_id)
+            if messages_file.exists():
+                if lines:
+                    with open(messages_file, 'ab') as f:
+                        f.write(b"".join(lines))
+                message_count = (previous.message_count if previous else 0) + len(new_messages)
+                total_cost = (previous.total_cost if previous else 0.0) + new_cost
+            else:
+                # No log yet: start it from the legacy single-file copy, if any
+                legacy_messages = self._read_legacy_messages(conversation_id)
+                legacy_lines = [_json_line(msg_data) for msg_data in legacy_messages]
+                self._write_bytes(messages_file, b"".join(legacy_lines + lines))
+                message_count = len(legacy_messages) + len(new_messages)
+                total_cost = sum(msg_data.get("cost", 0.0) or 0.0 for msg_data in legacy_messages) + new_cost
             
-            all_metadata = self._load_metadata()
+            all_metadata = dict(self._metadata)
             if conversation_id in all_metadata:
-                conv_metadata = all_metadata[conversation_id]
-                conv_metadata.updated_at = now
-                conv_metadata.message_count = len(messages)
-                conv_metadata.total_cost = total_cost
+                # Updated copy: the cached entry may be held by callers
+                conv_metadata = replace(
+                    all_metadata[conversation_id],
+                    updated_at=now,
+                    message_count=message_count,
+                    total_cost=total_cost
+                )
                 if indexed_documents is not None:
                     conv_metadata.indexed_documents = indexed_documents
                 
                 if conv_metadata.name == "New Chat" and messages:
                     conv_metadata.name = self._generate_conversation_name(messages)
+                all_metadata[conversation_id] = conv_metadata
             else:
                 conv_metadata = ConversationMetadata(
                     id=conversation_id,
@@ -169,49 +300,58 @@ class ConversationStorage:
                     working_directory=self.working_directory,
                     created_at=now,
                     updated_at=now,
-                    message_count=len(messages),
+                    message_count=message_count,
                     indexed_documents=indexed_documents or [],
                     total_cost=total_cost
                 )
                 all_metadata[conversation_id] = conv_metadata
             
-            conversation_data = {
-                "id": conversation_id,
-                "metadata": asdict(conv_metadata),
-                "messages": messages_data
-            }
+            self._write_meta_file(conv_metadata)
             
-            conversation_file = self._conversation_file_path(conversation_id)
-            with open(conversation_file, 'w') as f:
-                json.dump(conversation_data, f, indent=2)
+            # The log now holds these messages, so drop the old single-file copy
+            legacy_file = self._conversation_file_path(conversation_id)
+            if legacy_file.exists():
+                legacy_file.unlink()
             
             self._save_metadata(all_metadata)
+            return conv_metadata
             
         except Exception as e:
             print(f"Error saving conversation: {e}")
+            return None
     
     def load_conversation(self, conversation_id: str) -> Optional[tuple[ConversationMetadata, List[ConversationMessage]]]:
         """Load conversation by ID"""
         try:
-            conversation_file = self._conversation_file_path(conversation_id)
-            if not conversation_file.exists():
-                return None
-            
-            with open(conversation_file, 'r') as f:
-                data = json.load(f)
+            meta_file = self._meta_file_path(conversation_id)
+            if meta_file.exists():
+                with open(meta_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                
+                messages = []
+                messages_file = self._messages_file_path(conversation_id)
+                if messages_file.exists():
+                    with open(messages_file, 'rb') as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            try:
+                                msg_data = _json_loads(line)
+                            except ValueError:
+                                # A line cut short by a crash during append
+                                continue
+                            messages.append(self._message_from_dict(msg_data))
+            else:
+                conversation_file = self._conversation_file_path(conversation_id)
+                if not conversation_file.exists():
+                    return None
+                
+                with open(conversation_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                messages = [self._message_from_dict(msg_data) for msg_data in data["messages"]]
             
             metadata = ConversationMetadata(**data["metadata"])
             
-            messages = []
-            for msg_data in data["messages"]:
-                message = ConversationMessage(
-                    role=msg_data["role"],
-                    content=msg_data["content"],
-                    timestamp=datetime.fromisoformat(msg_data["timestamp"]),
-                    cost=msg_data.get("cost", 0.0)
-                )
-                messages.append(message)
-            
             self.current_conversation_id = conversation_id
             return metadata, messages
             
@@ -219,27 +359,45 @@ class ConversationStorage:
             print(f"Error loading conversation: {e}")
             return None
     
+    def get_conversation_metadata(self, conversation_id: str) -> Optional[ConversationMetadata]:
+        """Get metadata for a single conversation"""
+        return self.list_local_conversations_by_id().get(conversation_id)
+    
+    def list_local_conversations_by_id(self) -> Dict[str, ConversationMetadata]:
+        """Map conversation IDs to metadata for the current working directory"""
+        if self._local_by_id is None:
+            self._local_by_id = {
+                conv_id: metadata
+                for conv_id, metadata in self._metadata.items()
+                if metadata.working_directory == self.working_directory
+            }
+        return self._local_by_id
+    
     def list_local_conversations(self) -> List[ConversationMetadata]:
         """List conversations from current working directory only"""
-        all_metadata = self._load_metadata()
-        
-        local_conversations = []
-        for conv_id, metadata in all_metadata.items():
-            if metadata.working_directory == self.working_directory:
-                local_conversations.append(metadata)
-        
-        local_conversations.sort(key=lambda x: x.updated_at, reverse=True)
-        return local_conversations
+        local_sorted = self._local_sorted
+        if local_sorted is None:
+            local_sorted = sorted(
+                self.list_local_conversations_by_id().values(),
+                key=lambda x: x.updated_at,
+                reverse=True
+            )
+            self._local_sorted = local_sorted
+        return list(local_sorted)
     
     def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation"""
         try:
-            conversation_file = self._conversation_file_path(conversation_id)
-            if conversation_file.exists():
-                conversation_file.unlink()
+            for path in (
+                self._meta_file_path(conversation_id),
+                self._messages_file_path(conversation_id),
+                self._conversation_file_path(conversation_id),
+            ):
+                if path.exists():
+                    path.unlink()
             
-            all_metadata = self._load_metadata()
-            if conversation_id in all_metadata:
+            if conversation_id in self._metadata:
+                all_metadata = dict(self._metadata)
                 del all_metadata[conversation_id]
                 self._save_metadata(all_metadata)
             
@@ -254,23 +412,28 @@ class ConversationStorage:
     def rename_conversation(self, conversation_id: str, new_name: str) -> bool:
         """Rename a conversation"""
         try:
-            all_metadata = self._load_metadata()
-            if conversation_id not in all_metadata:
+            if conversation_id not in self._metadata:
                 return False
             
-            all_metadata[conversation_id].name = new_name
-            all_metadata[conversation_id].updated_at = datetime.now().isoformat()
+            all_metadata = dict(self._metadata)
+            all_metadata[conversation_id] = replace(
+                all_metadata[conversation_id],
+                name=new_name,
+                updated_at=datetime.now().isoformat()
+            )
             
+            # Only the metadata header changes; the message log is left alone
             conversation_file = self._conversation_file_path(conversation_id)
-            if conversation_file.exists():
-                with open(conversation_file, 'r') as f:
-                    data = json.load(f)
+            if self._meta_file_path(conversation_id).exists():
+                self._write_meta_file(all_metadata[conversation_id])
+            elif conversation_file.exists():
+                with open(conversation_file, 'rb') as f:
+                    data = _json_loads(f.read())
                 
                 data["metadata"]["name"] = new_name
                 data["metadata"]["updated_at"] = all_metadata[conversation_id].updated_at
                 
-                with open(conversation_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                self._write_json(conversation_file, data)
             
             self._save_metadata(all_metadata)
             return True
@@ -281,7 +444,40 @@ class ConversationStorage:
     
     def get_last_conversation(self) -> Optional[str]:
         """Get the most recently updated conversation ID from current directory"""
-        conversations = self.list_local_conversations()
+        conversations = self.list_local_conversations_by_id()
         if conversations:
-            return conversations[0].id
-        return None
\ No newline at end of file
+            return max(conversations.values(), key=lambda x: x.updated_at).id
+        return None
+    
+    async def _run_io(self, func: Callable, *args) -> Any:
+        """Run a blocking storage call on the conversation I/O worker"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, func, *args)
+    
+    async def save_conversation_async(self, conversation_id: str, messages: List[ConversationMessage],
+                                      indexed_documents: List[str] = None,
+                                      new_count: Optional[int] = None) -> Optional[ConversationMetadata]:
+        """Save conversation messages without blocking the event loop"""
+        return await self._run_io(
+            self.save_conversation, conversation_id, messages, indexed_documents, new_count
+        )
+    
+    async def load_conversation_async(self, conversation_id: str):
+        """Load conversation by ID without blocking the event loop"""
+        return await self._run_io(self.load_conversation, conversation_id)
+    
+    async def get_last_conversation_async(self) -> Optional[str]:
+        """Get the most recent conversation ID without blocking the event loop"""
+        return await self._run_io(self.get_last_conversation)
+    
+    async def create_new_conversation_async(self, indexed_documents: List[str] = None) -> str:
+        """Create a new conversation without blocking the event loop"""
+        return await self._run_io(self.create_new_conversation, indexed_documents)
+    
+    async def get_conversation_metadata_async(self, conversation_id: str) -> Optional[ConversationMetadata]:
+        """Get metadata for a single conversation without blocking the event loop"""
+        return await self._run_io(self.get_conversation_metadata, conversation_id)
+    
+    async def delete_conversation_async(self, conversation_id: str) -> bool:
+        """Delete a conversation without blocking the event loop"""
+        return await self._run_io(self.delete_conversation, conversation_id)
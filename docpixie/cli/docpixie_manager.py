@@ -3,20 +3,36 @@ DocPixie integration manager for CLI application
 """
 
 import asyncio
-from typing import TYPE_CHECKING, Optional, Any, Callable
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Callable, List, Tuple, Union
 from pathlib import Path
 
-from docpixie import DocPixie, ConversationMessage
-from docpixie.core.config import DocPixieConfig
-from docpixie.models.document import Document
+from textual.timer import Timer
+
+from docpixie.models.agent import ConversationMessage
 
 from .config import get_config_manager
 from .state_manager import AppStateManager
-from .widgets import ChatArea, DocumentManagerDialog
+from .widgets import DocumentManagerDialog
 
 if TYPE_CHECKING:
+    from docpixie import DocPixie
+    from docpixie.models.document import Document
     from .app import DocPixieTUI
 
+# Idle delay before finished turns are written to disk, and the number of
+# unsaved messages that forces an immediate write
+CONVERSATION_SAVE_DELAY = 2.0
+CONVERSATION_SAVE_MAX_PENDING = 20
+
+# Messages each finished query adds to the conversation (question and answer)
+MESSAGES_PER_TURN = 2
+
+# Upper bound on concurrent get_document calls when loading indexed documents
+DOCUMENT_LOAD_CONCURRENCY = 16
+
 
 class DocPixieManager:
     """Manages DocPixie instance and all related operations"""
@@ -25,7 +41,38 @@ class DocPixieManager:
         self.app = app
         self.state_manager = state_manager
         self.config_manager = get_config_manager()
-        self.docpixie: Optional[DocPixie] = None
+        self.docpixie: Optional['DocPixie'] = None
+        # (folder mtimes, documents) from the last storage scan
+        self._indexed_names_cache: Optional[Tuple[Tuple[int, int], List['Document']]] = None
+        # (folder mtime, PDF file names) from the last documents folder scan
+        self._pdf_scan_cache: Optional[Tuple[int, List[str]]] = None
+        self._save_timer: Optional[Timer] = None
+        # Instances replaced by a model switch while a query was still using them
+        self._retired_docpixie: List['DocPixie'] = []
+        # Dedicated, pre-started workers for queries so they never queue behind
+        # other users of the loop's default executor
+        self._query_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="docpixie-query"
+        )
+        self._query_executor.submit(lambda: None)
+
+    @staticmethod
+    def _build_docpixie(api_key: str, text_model: str, vision_model: str) -> 'DocPixie':
+        """Import and construct the DocPixie backend for the configured models"""
+        from docpixie import DocPixie
+        from docpixie.core.config import DocPixieConfig
+
+        config = DocPixieConfig(
+            provider="openrouter",
+            model=text_model,
+            vision_model=vision_model,
+            storage_type="local",
+            local_storage_path="./.docpixie/documents",
+            openrouter_api_key=api_key,
+            jpeg_quality=85,
+            max_pages_per_task=4
+        )
+        return DocPixie(config=config)
 
     async def create_docpixie_instance(self) -> bool:
         try:
@@ -35,31 +82,24 @@ class DocPixieManager:
 
             text_model, vision_model = self.config_manager.get_models()
 
-            config = DocPixieConfig(
-                provider="openrouter",
-                model=text_model,
-                vision_model=vision_model,
-                storage_type="local",
-                local_storage_path="./.docpixie/documents",
-                openrouter_api_key=api_key,
-                jpeg_quality=85,
-                max_pages_per_task=4
+            # Importing and constructing the backend happens in a worker thread
+            # so the UI keeps painting while the provider stack loads
+            self.docpixie = await asyncio.get_running_loop().run_in_executor(
+                None, self._build_docpixie, api_key, text_model, vision_model
             )
-
-            self.docpixie = DocPixie(config=config)
             self.app.docpixie = self.docpixie
             return True
 
         except Exception as e:
             try:
-                chat_log = self.app.query_one("#chat-log", ChatArea)
+                chat_log = self.app.chat_log
                 chat_log.write(f"[error]❌ Failed to create DocPixie instance: {e}[/error]")
             except:
                 pass
             return False
 
     async def initialize_docpixie(self, show_welcome: bool = True) -> None:
-        chat_log = self.app.query_one("#chat-log", ChatArea)
+        chat_log = self.app.chat_log
 
         if not await self.create_docpixie_instance():
             chat_log.write("[error]❌ No API key configured. Please restart and configure.[/error]")
@@ -69,33 +109,69 @@ class DocPixieManager:
             await self.check_and_prompt_for_documents()
             await self.load_or_create_conversation()
 
-            if show_welcome:
-                self.app.show_welcome_message()
-
-            if self.state_manager.current_conversation_id and self.state_manager.conversation_history:
-                chat_log.add_static_text("[dim]━━━ Restored previous conversation ━━━[/dim]\n\n")
+            with self.app.batch_update():
+                if show_welcome:
+                    self.app.show_welcome_message()
 
-                for msg in self.state_manager.conversation_history:
-                    if msg.role == "user":
-                        chat_log.add_user_message(msg.content)
-                    else:
-                        chat_log.add_assistant_message(msg.content)
-
-                chat_log.add_static_text("[dim]━━━ Continue your conversation below ━━━[/dim]\n\n")
+                if self.state_manager.current_conversation_id and self.state_manager.conversation_history:
+                    chat_log.add_static_text("[dim]━━━ Restored previous conversation ━━━[/dim]\n\n")
+                    chat_log.add_messages_bulk([
+                        (msg.role, msg.content)
+                        for msg in self.state_manager.conversation_history
+                    ])
+                    chat_log.add_static_text("[dim]━━━ Continue your conversation below ━━━[/dim]\n\n")
 
         except Exception as e:
             chat_log.write(f"[error]❌ Failed to initialize: {e}[/error]")
 
     async def switch_models(self) -> None:
-        await self.create_docpixie_instance()
+        previous = self.docpixie
+        if await self.create_docpixie_instance() and previous is not None:
+            self._retired_docpixie.append(previous)
+            if not self.state_manager.processing:
+                await self._close_retired_docpixie()
+
+    async def _close_retired_docpixie(self) -> None:
+        """Close the HTTP clients of instances no longer in use"""
+        retired, self._retired_docpixie = self._retired_docpixie, []
+        for instance in retired:
+            await instance.aclose()
+
+    def _documents_snapshot_key(self) -> Optional[Tuple[int, int]]:
+        """Modification times of the documents folder and the index storage"""
+        try:
+            storage_path = Path(self.docpixie.config.local_storage_path)
+            return (
+                self.state_manager.documents_folder.stat().st_mtime_ns,
+                storage_path.stat().st_mtime_ns,
+            )
+        except (OSError, AttributeError, TypeError):
+            return None
+
+    def scan_pdf_names(self) -> List[str]:
+        """List PDF file names in the documents folder, rescanning only when it changes"""
+        folder = self.state_manager.documents_folder
+        mtime = os.stat(folder).st_mtime_ns
+        if self._pdf_scan_cache and self._pdf_scan_cache[0] == mtime:
+            return self._pdf_scan_cache[1]
+
+        with os.scandir(folder) as entries:
+            pdf_names = [
+                entry.name for entry in entries
+                if entry.name.endswith('.pdf') and entry.is_file()
+            ]
+
+        self._pdf_scan_cache = (mtime, pdf_names)
+        return pdf_names
 
     async def check_and_prompt_for_documents(self) -> None:
-        chat_log = self.app.query_one("#chat-log", ChatArea)
+        chat_log = self.app.chat_log
 
         if not self.state_manager.documents_folder.exists():
             self.state_manager.documents_folder.mkdir(parents=True)
-            chat_log.write(f"[green bold]●[/green bold] Created documents folder: {self.state_manager.documents_folder.absolute()}\n")
-            chat_log.write("[blue bold]●[/blue bold] Add PDF files to the ./documents folder or use /documents to manage them.\n")
+            with chat_log.batch() as batch:
+                batch.write(f"[green bold]●[/green bold] Created documents folder: {self.state_manager.documents_folder.absolute()}\n")
+                batch.write("[blue bold]●[/blue bold] Add PDF files to the ./documents folder or use /documents to manage them.\n")
             # Auto-open the Document Manager when the folder is first created
             await self.app.push_screen(DocumentManagerDialog(
                 self.state_manager.documents_folder,
@@ -105,22 +181,35 @@ class DocPixieManager:
 
         self.state_manager.clear_documents()
 
-        try:
-            existing_docs = await self.docpixie.list_documents()
-            indexed_names = {doc['name'] for doc in existing_docs}
+        snapshot_key = self._documents_snapshot_key()
+        cached = self._indexed_names_cache
+        if snapshot_key is not None and cached and cached[0] == snapshot_key:
+            self.state_manager.set_documents(cached[1])
+        else:
+            try:
+                existing_docs = await self.docpixie.list_documents()
 
-            for doc_meta in existing_docs:
-                doc = await self.docpixie.get_document(doc_meta['id'])
-                if doc:
-                    self.state_manager.add_document(doc)
+                semaphore = asyncio.Semaphore(DOCUMENT_LOAD_CONCURRENCY)
 
-        except Exception as e:
-            indexed_names = set()
-            chat_log.write(f"[dim]Note: Could not load existing documents: {e}[/dim]\\n")
+                async def load_document(document_id: str):
+                    async with semaphore:
+                        return await self.docpixie.get_document(document_id)
+
+                loaded = await asyncio.gather(
+                    *(load_document(doc_meta['id']) for doc_meta in existing_docs)
+                )
+                documents = [doc for doc in loaded if doc]
+                self.state_manager.set_documents(documents)
 
-        pdf_files = list(self.state_manager.documents_folder.glob("*.pdf"))
+                if snapshot_key is not None:
+                    self._indexed_names_cache = (snapshot_key, documents)
 
-        if not pdf_files:
+            except Exception as e:
+                chat_log.write(f"[dim]Note: Could not load existing documents: {e}[/dim]\n")
+
+        pdf_names = self.scan_pdf_names()
+
+        if not pdf_names:
             # Auto-open the Document Manager when there are no PDFs yet
             await self.app.push_screen(DocumentManagerDialog(
                 self.state_manager.documents_folder,
@@ -128,9 +217,10 @@ class DocPixieManager:
             ))
             return
 
+        indexed_names = self.state_manager.indexed_names
         new_pdf_files = [
-            pdf for pdf in pdf_files
-            if pdf.stem not in indexed_names
+            name for name in pdf_names
+            if name[:-4] not in indexed_names
         ]
 
         if new_pdf_files:
@@ -142,25 +232,22 @@ class DocPixieManager:
 
     async def load_or_create_conversation(self) -> None:
         try:
-            doc_ids = [doc.id for doc in self.state_manager.indexed_documents]
-            last_conversation_id = self.state_manager.get_last_conversation_id()
+            last_conversation_id = await self.state_manager.get_last_conversation_id_async()
 
             if last_conversation_id:
-                if self.state_manager.load_conversation(last_conversation_id):
-                    status_label = self.app.query_one("#status-label")
-                    status_label.update(self.state_manager.get_status_text())
+                if await self.state_manager.load_conversation_async(last_conversation_id):
+                    self.app.refresh_status()
                     return
 
-            self.state_manager.create_new_conversation()
-            status_label = self.app.query_one("#status-label")
-            status_label.update(self.state_manager.get_status_text())
+            await self.state_manager.create_new_conversation_async()
+            self.app.refresh_status()
 
         except Exception as e:
             print(f"Error loading conversation: {e}")
             self.state_manager.set_current_conversation(None)
 
     async def process_query(self, query: str, task_callback: Optional[Callable] = None) -> None:
-        chat_log = self.app.query_one("#chat-log", ChatArea)
+        chat_log = self.app.chat_log
 
         if not self.docpixie:
             chat_log.write("[error]❌ DocPixie not initialized[/error]\\n")
@@ -175,58 +262,101 @@ class DocPixieManager:
         try:
             chat_log.show_processing_status()
 
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.docpixie.query_sync,
-                query,
-                None,  # mode
-                None,  # document_ids
-                None,  # max_pages
-                self.state_manager.conversation_history,
-                task_callback
+            # Freeze the history so the worker thread never sees appends
+            # made on the event loop while the query is running
+            history_snapshot = tuple(self.state_manager.conversation_history)
+
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._query_executor,
+                partial(
+                    self.docpixie.query_sync,
+                    query,
+                    None,  # mode
+                    None,  # document_ids
+                    None,  # max_pages
+                    history_snapshot,
+                    task_callback
+                )
             )
 
-            chat_log.add_assistant_message(result.answer)
+            cost = result.total_cost or 0.0
+
+            # The answer and its details land in a single refresh
+            with self.app.batch_update():
+                chat_log.add_assistant_message(result.answer)
 
-            if hasattr(result, 'get_pages_by_document'):
-                pages_by_doc = result.get_pages_by_document()
-                if pages_by_doc:
-                    chat_log.write("[dim]Analyzed documents:[/dim]\n")
-                    for doc_name, page_nums in pages_by_doc.items():
-                        pages_str = ", ".join(str(p) for p in page_nums)
-                        chat_log.write(f"[dim]  • {doc_name}: Pages {pages_str}[/dim]\n")
-            elif hasattr(result, 'page_numbers') and result.page_numbers:
-                chat_log.write(f"[dim]Analyzed pages: {result.page_numbers}[/dim]\n")
+                with chat_log.batch() as details:
+                    pages_by_doc = result.get_pages_by_document()
+                    if pages_by_doc:
+                        details.write("[dim]Analyzed documents:[/dim]\n")
+                        for doc_name, page_nums in pages_by_doc.items():
+                            pages_str = ", ".join(str(p) for p in page_nums)
+                            details.write(f"[dim]  • {doc_name}: Pages {pages_str}[/dim]\n")
 
-            if hasattr(result, 'processing_time') and result.processing_time > 0:
-                chat_log.write(f"[dim]Processing time: {result.processing_time:.2f}s[/dim]\n")
+                    if result.processing_time > 0:
+                        details.write(f"[dim]Processing time: {result.processing_time:.2f}s[/dim]\n")
 
-            cost = getattr(result, 'total_cost', 0.0) or 0.0
-            if cost < 0.01:
-                chat_log.write(f"[dim]Cost: ${cost:.6f}[/dim]\n")
-            else:
-                chat_log.write(f"[dim]Cost: ${cost:.4f}[/dim]\n")
+                    cost_format = ".6f" if cost < 0.01 else ".4f"
+                    details.write(f"[dim]Cost: ${cost:{cost_format}}[/dim]\n")
 
-            chat_log.write("\n")
+                    details.write("\n")
 
             self.state_manager.add_conversation_message(
                 ConversationMessage(role="user", content=query)
             )
             self.state_manager.add_conversation_message(
-                ConversationMessage(role="assistant", content=result.answer,
-                                  cost=getattr(result, 'total_cost', 0.0) or 0.0)
+                ConversationMessage(role="assistant", content=result.answer, cost=cost)
             )
 
-            self.state_manager.limit_conversation_history()
-            self.state_manager.save_current_conversation()
+            await self.schedule_conversation_save()
 
-            status_label = self.app.query_one("#status-label")
-            status_label.update(self.state_manager.get_status_text())
+            self.app.refresh_status()
 
         except Exception as e:
             chat_log.write(f"[red bold]●[/red bold] Error: {e}\n\n")
         finally:
             self.state_manager.set_processing(False)
+            if self._retired_docpixie:
+                await self._close_retired_docpixie()
+
+    def shutdown(self) -> None:
+        """Release the query workers without waiting for a running query"""
+        self._query_executor.shutdown(wait=False)
+
+    async def schedule_conversation_save(self) -> None:
+        """Coalesce conversation saves into one write after a short idle period"""
+        # Write before the next turn could push unsaved messages out of the
+        # history window
+        max_pending = max(1, min(
+            CONVERSATION_SAVE_MAX_PENDING,
+            self.state_manager.max_conversation_history - MESSAGES_PER_TURN
+        ))
+        if self.state_manager.unsaved_messages >= max_pending:
+            await self.flush_conversation_save()
+        elif self._save_timer is None:
+            self._save_timer = self.app.set_timer(
+                CONVERSATION_SAVE_DELAY, self.flush_conversation_save
+            )
+
+    async def flush_conversation_save(self) -> None:
+        """Write any unsaved conversation messages to disk now"""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        if self.state_manager.unsaved_messages:
+            await self.state_manager.save_current_conversation_async()
+            # The save updates the conversation's name and cost
+            self.app.refresh_status()
+
+    async def delete_documents(self, document_ids: List[str]) -> List[Union[bool, BaseException]]:
+        """Delete documents from storage concurrently, one result per id"""
+        if not self.docpixie or not document_ids:
+            return [False] * len(document_ids)
+
+        return await asyncio.gather(
+            *(self.docpixie.delete_document(doc_id) for doc_id in document_ids),
+            return_exceptions=True
+        )
 
     def delete_document_sync(self, document_id: str) -> bool:
         if self.docpixie:
@@ -4,17 +4,22 @@ Event handling mixins for DocPixie CLI
 
 from typing import TYPE_CHECKING
 from textual import events
-from textual.widgets import TextArea, Label
+from textual.widgets import TextArea
 from .widgets import (
-    CommandPalette, CommandSelected, CommandAutoComplete,
+    CommandSelected, CommandAutoComplete,
     ConversationSelected, ConversationDeleted,
-    ModelSelected, DocumentRemoved, DocumentsIndexed,
-    ChatArea
+    ModelSelected, DocumentRemoved, DocumentsIndexed
 )
 
 if TYPE_CHECKING:
     from .app import DocPixieTUI
 
+# Delay before the command palette reacts to typing in the chat input
+PALETTE_DEBOUNCE_SECONDS = 0.05
+
+# Window for coalescing back-to-back DocumentsIndexed events
+INDEXED_FLUSH_SECONDS = 0.1
+
 
 class CommandEventMixin:
     """Handles command palette and text input events"""
@@ -24,33 +29,54 @@ class CommandEventMixin:
         if event.text_area.id != "chat-input":
             return
 
-        lines = event.text_area.text.split('\\n')
-        if lines:
-            current_line = lines[-1] if lines else ""
-
-            if current_line.startswith("/"):
-                command_palette = self.query_one("#command-palette", CommandPalette)
-                if not self.state_manager.command_palette_active:
-                    self.state_manager.command_palette_active = True
-                    command_palette.show(current_line)
-                else:
-                    command_palette.update_filter(current_line)
+        # Ordinary typing: nothing to do unless the current line is a command
+        if not self.state_manager.command_palette_active:
+            text = event.text_area.text
+            if not text.startswith("/", text.rfind("\n") + 1):
+                return
+
+        # Coalesce bursts of keystrokes into a single palette update
+        if self._palette_debounce is not None:
+            self._palette_debounce.stop()
+        text_area = event.text_area
+        self._palette_debounce = self.set_timer(
+            PALETTE_DEBOUNCE_SECONDS, lambda: self._apply_palette_filter(text_area)
+        )
+
+    def _apply_palette_filter(self: 'DocPixieTUI', text_area: TextArea) -> None:
+        """Show, filter or hide the command palette for the current input line"""
+        self._palette_debounce = None
+        current_line = text_area.text.rpartition('\n')[2]
+
+        # Nothing to do if neither the line nor the palette state has changed
+        palette_key = (current_line, self.state_manager.command_palette_active)
+        if palette_key == self._last_palette_key:
+            return
+
+        if current_line.startswith("/"):
+            command_palette = self._palette
+            if not self.state_manager.command_palette_active:
+                self.state_manager.command_palette_active = True
+                command_palette.show(current_line)
             else:
-                if self.state_manager.command_palette_active:
-                    command_palette = self.query_one("#command-palette", CommandPalette)
-                    command_palette.hide()
-                    self.state_manager.command_palette_active = False
+                command_palette.update_filter(current_line)
+        else:
+            if self.state_manager.command_palette_active:
+                command_palette = self._palette
+                command_palette.hide()
+                self.state_manager.command_palette_active = False
+
+        self._last_palette_key = (current_line, self.state_manager.command_palette_active)
 
     async def on_key(self: 'DocPixieTUI', event: events.Key) -> None:
         """Handle key events for command palette navigation"""
         if self.state_manager.command_palette_active:
-            command_palette = self.query_one("#command-palette", CommandPalette)
+            command_palette = self._palette
 
             if event.key == "escape":
                 command_palette.hide()
                 self.state_manager.command_palette_active = False
-                text_area = self.query_one("#chat-input")
-                text_area.clear()
+                self._clear_chat_input()
                 event.prevent_default()
 
             elif event.key == "up":
@@ -64,25 +90,24 @@ class CommandEventMixin:
             elif event.key == "tab":
                 selected = command_palette.get_selected_command()
                 if selected:
-                    text_area = self.query_one("#chat-input")
+                    text_area = self._chat_input
                     text_area.text = selected.command
                     text_area.cursor_location = (0, len(selected.command))
                 event.prevent_default()
 
     async def on_command_selected(self: 'DocPixieTUI', event: CommandSelected) -> None:
         """Handle command selection from palette"""
-        command_palette = self.query_one("#command-palette", CommandPalette)
+        command_palette = self._palette
         command_palette.hide()
         self.state_manager.command_palette_active = False
 
-        text_area = self.query_one("#chat-input")
-        text_area.clear()
+        self._clear_chat_input()
 
         await self.handle_command(event.command)
 
     async def on_command_auto_complete(self: 'DocPixieTUI', event: CommandAutoComplete) -> None:
         """Handle command auto-completion"""
-        text_area = self.query_one("#chat-input")
+        text_area = self._chat_input
         text_area.text = event.command
         text_area.cursor_location = (0, len(event.command))
 
@@ -92,35 +117,30 @@ class ConversationEventMixin:
 
     async def on_conversation_selected(self: 'DocPixieTUI', event: ConversationSelected) -> None:
         """Handle conversation selection from dialog"""
-        chat_log = self.query_one("#chat-log", ChatArea)
+        chat_log = self._chat_log
 
         if event.conversation_id == "new":
             await self.handle_command("/new")
             return
 
         try:
-            self.state_manager.save_current_conversation()
+            await self.state_manager.save_current_conversation_async()
 
-            if self.state_manager.load_conversation(event.conversation_id):
-                conversations = self.state_manager.conversation_storage.list_local_conversations()
-                metadata = next(
-                    (conv for conv in conversations if conv.id == event.conversation_id),
-                    None
-                )
+            if await self.state_manager.load_conversation_async(event.conversation_id):
+                metadata = self.state_manager.current_conversation_meta
+                conv_name = metadata.name if metadata else "Unknown"
 
-                chat_log.clear()
+                with self.batch_update():
+                    chat_log.clear()
 
-                for msg in self.state_manager.conversation_history:
-                    if msg.role == "user":
-                        chat_log.add_user_message(msg.content)
-                    else:
-                        chat_log.add_assistant_message(msg.content)
+                    chat_log.add_messages_bulk([
+                        (msg.role, msg.content)
+                        for msg in self.state_manager.conversation_history
+                    ])
 
-                status_label = self.query_one("#status-label", Label)
-                status_label.update(self.state_manager.get_status_text())
+                    self.refresh_status()
 
-                conv_name = metadata.name if metadata else "Unknown"
-                chat_log.write(f"[green bold]●[/green bold] Loaded conversation: {conv_name}\n\n")
+                    chat_log.write(f"[green bold]●[/green bold] Loaded conversation: {conv_name}\n\n")
             else:
                 chat_log.write("[red bold]●[/red bold] Failed to load conversation\n\n")
 
@@ -129,7 +149,7 @@ class ConversationEventMixin:
 
     async def on_conversation_deleted(self: 'DocPixieTUI', event: ConversationDeleted) -> None:
         """Handle conversation deletion"""
-        chat_log = self.query_one("#chat-log", ChatArea)
+        chat_log = self._chat_log
         chat_log.write("[green bold]●[/green bold] Conversation deleted\n\n")
 
 
@@ -138,7 +158,7 @@ class ModelEventMixin:
 
     async def on_model_selected(self: 'DocPixieTUI', event: ModelSelected) -> None:
         """Handle model selection"""
-        chat_log = self.query_one("#chat-log", ChatArea)
+        chat_log = self._chat_log
 
         if event.old_text_model and event.text_model != event.old_text_model:
             chat_log.write(f"[green bold]●[/green bold] Action model switched to {event.text_model}\n\n")
@@ -149,8 +169,8 @@ class ModelEventMixin:
         else:
             chat_log.write("[dim]No model changes made[/dim]\n\n")
 
-        status_label = self.query_one("#status-label", Label)
-        status_label.update(self.state_manager.get_status_text())
+        self.state_manager.refresh_model_names()
+        self.refresh_status()
 
 
 class DocumentEventMixin:
@@ -158,45 +178,55 @@ class DocumentEventMixin:
 
     async def on_document_removed(self: 'DocPixieTUI', event: DocumentRemoved) -> None:
         """Handle document removal"""
-        chat_log = self.query_one("#chat-log", ChatArea)
-
-        removed_count = 0
-        for doc_id in event.document_ids:
-            if self.state_manager.remove_document(doc_id):
-                removed_count += 1
-
-                if self.docpixie:
-                    try:
-                        success = self.docpixie_manager.delete_document_sync(doc_id)
-                        if not success:
-                            doc_name = f"Document {doc_id}"  # Fallback name
-                            chat_log.write(f"[warning]Warning: Could not delete {doc_name} from storage[/warning]\n")
-                    except Exception as e:
-                        doc_name = f"Document {doc_id}"  # Fallback name
-                        chat_log.write(f"[error]Error deleting {doc_name}: {e}[/error]\n")
-
-        if removed_count == 1:
-            chat_log.write(f"[green bold]●[/green bold] Removed 1 document from index\n\n")
-        else:
-            chat_log.write(f"[green bold]●[/green bold] Removed {removed_count} documents from index\n\n")
+        chat_log = self._chat_log
+
+        removed = self.state_manager.remove_documents(event.document_ids)
+        removed_ids = [doc.id for doc in removed]
+        removed_count = len(removed_ids)
+
+        results = []
+        if self.docpixie and removed_ids:
+            results = await self.docpixie_manager.delete_documents(removed_ids)
+
+        with self.batch_update(), chat_log.batch() as batch:
+            for doc, result in zip(removed, results):
+                doc_name = doc.name or f"Document {doc.id}"
+                if isinstance(result, Exception):
+                    batch.write(f"[error]Error deleting {doc_name}: {result}[/error]\n")
+                elif not result:
+                    batch.write(f"[warning]Warning: Could not delete {doc_name} from storage[/warning]\n")
+
+            if removed_count == 1:
+                batch.write(f"[green bold]●[/green bold] Removed 1 document from index\n\n")
+            else:
+                batch.write(f"[green bold]●[/green bold] Removed {removed_count} documents from index\n\n")
 
-        status_label = self.query_one("#status-label", Label)
-        status_label.update(self.state_manager.get_status_text())
+            self.refresh_status()
 
     async def on_documents_indexed(self: 'DocPixieTUI', event: DocumentsIndexed) -> None:
         """Handle documents being indexed"""
-        chat_log = self.query_one("#chat-log", ChatArea)
+        self._indexed_queue.extend(event.documents)
+
+        # Announce a burst of indexing events once
+        if self._indexed_flush is not None:
+            self._indexed_flush.stop()
+        self._indexed_flush = self.set_timer(INDEXED_FLUSH_SECONDS, self._flush_indexed)
+
+    def _flush_indexed(self: 'DocPixieTUI') -> None:
+        """Record queued indexed documents and report them in one update"""
+        self._indexed_flush = None
+        queued, self._indexed_queue = self._indexed_queue, []
+        if not queued:
+            return
 
-        indexed_count = 0
-        for doc in event.documents:
-            if not any(existing.id == doc.id for existing in self.state_manager.indexed_documents):
-                self.state_manager.add_document(doc)
-                indexed_count += 1
+        chat_log = self._chat_log
 
-        if indexed_count == 1:
-            chat_log.write(f"[green bold]●[/green bold] Successfully indexed 1 document\n\n")
-        else:
-            chat_log.write(f"[green bold]●[/green bold] Successfully indexed {indexed_count} documents\n\n")
+        indexed_count = len(self.state_manager.add_documents(queued))
+
+        with self.batch_update():
+            if indexed_count == 1:
+                chat_log.write(f"[green bold]●[/green bold] Successfully indexed 1 document\n\n")
+            else:
+                chat_log.write(f"[green bold]●[/green bold] Successfully indexed {indexed_count} documents\n\n")
 
-        status_label = self.query_one("#status-label", Label)
-        status_label.update(self.state_manager.get_status_text())
+            self.refresh_status()
@@ -6,14 +6,22 @@ DocPixie CLI - Interactive document chat interface
 import os
 import sys
 import asyncio
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Any, Dict
-from datetime import datetime
+from typing import TYPE_CHECKING, Deque, List, Optional, Any, Tuple
 
-from docpixie import DocPixie, ConversationMessage
-from docpixie.core.config import DocPixieConfig
-from docpixie.models.document import Document, QueryResult
-from docpixie.models.agent import TaskStatus
+from docpixie.models.agent import ConversationMessage, TaskStatus
+
+if TYPE_CHECKING:
+    from docpixie import DocPixie
+    from docpixie.models.document import Document, QueryResult
+
+
+# Messages kept in the conversation; older ones drop off as new ones arrive
+MAX_CONVERSATION_HISTORY = 20
+
+# Upper bound on PDFs indexed at once
+INDEXING_CONCURRENCY = 4
 
 
 class DocPixieCLI:
@@ -22,9 +30,9 @@ class DocPixieCLI:
     def __init__(self):
         """Initialize the CLI application"""
         self.documents_folder = Path("./documents")
-        self.docpixie: Optional[DocPixie] = None
-        self.indexed_documents: List[Document] = []
-        self.conversation_history: List[ConversationMessage] = []
+        self.docpixie: Optional['DocPixie'] = None
+        self.indexed_documents: List['Document'] = []
+        self.conversation_history: Deque[ConversationMessage] = deque(maxlen=MAX_CONVERSATION_HISTORY)
         self.current_task_plan = None
 
     def initialize_docpixie(self) -> bool:
@@ -36,6 +44,10 @@ class DocPixieCLI:
                 print("Please set it with: export OPENROUTER_API_KEY='your-api-key'")
                 return False
 
+            # Deferred so the banner prints before the provider stack is imported
+            from docpixie import DocPixie
+            from docpixie.core.config import DocPixieConfig
+
             config = DocPixieConfig(
                 provider="openrouter",
                 model="openai/gpt-5-mini",
@@ -60,7 +72,11 @@ class DocPixieCLI:
             self.documents_folder.mkdir(parents=True)
             print(f"📁 Created documents folder: {self.documents_folder.absolute()}")
 
-        pdf_files = list(self.documents_folder.glob("*.pdf"))
+        with os.scandir(self.documents_folder) as entries:
+            pdf_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.pdf') and entry.is_file()
+            ]
 
         if not pdf_files:
             print(f"📭 No PDF files found in {self.documents_folder.absolute()}")
@@ -80,24 +96,8 @@ class DocPixieCLI:
 
         print(f"\n🔄 Starting document indexing...")
 
-        for i, pdf_file in enumerate(pdf_files, 1):
-            try:
-                print(f"\n📄 Processing ({i}/{len(pdf_files)}): {pdf_file.name}")
-
-                document = self.docpixie.add_document_sync(
-                    file_path=str(pdf_file),
-                    document_name=pdf_file.stem
-                )
-
-                self.indexed_documents.append(document)
-                print(f"   ✅ Indexed: {document.page_count} pages")
-
-                if document.summary:
-                    print(f"   📝 Summary: {document.summary[:100]}...")
-
-            except Exception as e:
-                print(f"   ❌ Failed to index {pdf_file.name}: {e}")
-                continue
+        # Documents are independent, so index a few at a time and report each as it finishes
+        asyncio.run(self._index_documents_concurrently(pdf_files))
 
         successful = len(self.indexed_documents)
         if successful > 0:
@@ -107,6 +107,35 @@ class DocPixieCLI:
             print(f"\n❌ Failed to index any documents")
             return False
 
+    async def _index_documents_concurrently(self, pdf_files: List[Path]) -> None:
+        """Index PDFs with bounded concurrency, reporting each one as it completes"""
+        semaphore = asyncio.Semaphore(INDEXING_CONCURRENCY)
+
+        async def index_one(pdf_file: Path) -> Tuple[Path, Any]:
+            async with semaphore:
+                try:
+                    document = await self.docpixie.add_document(
+                        file_path=str(pdf_file), document_name=pdf_file.stem
+                    )
+                    return pdf_file, document
+                except Exception as e:
+                    return pdf_file, e
+
+        pending = [index_one(pdf_file) for pdf_file in pdf_files]
+        for i, finished in enumerate(asyncio.as_completed(pending), 1):
+            pdf_file, result = await finished
+            print(f"\n📄 Processed ({i}/{len(pdf_files)}): {pdf_file.name}")
+
+            if isinstance(result, Exception):
+                print(f"   ❌ Failed to index {pdf_file.name}: {result}")
+                continue
+
+            self.indexed_documents.append(result)
+            print(f"   ✅ Indexed: {result.page_count} pages")
+
+            if result.summary:
+                print(f"   📝 Summary: {result.summary[:100]}...")
+
     def display_welcome_message(self):
         """Display welcome message and instructions"""
         print("\n" + "="*60)
@@ -119,7 +148,7 @@ class DocPixieCLI:
         print("  Ctrl+C - Force exit")
         print("\n" + "-"*60)
 
-    def format_answer(self, result: QueryResult) -> str:
+    def format_answer(self, result: 'QueryResult') -> str:
         """Format the query result for display"""
         output = []
 
@@ -235,7 +264,7 @@ class DocPixieCLI:
                     break
 
                 if user_input.lower() == "/new":
-                    self.conversation_history = []
+                    self.conversation_history.clear()
                     print("\n🔄 Started new conversation")
                     continue
 
@@ -243,7 +272,7 @@ class DocPixieCLI:
 
                 result = self.docpixie.query_sync(
                     question=user_input,
-                    conversation_history=self.conversation_history,
+                    conversation_history=list(self.conversation_history),
                     task_update_callback=self.task_update_callback
                 )
 
@@ -256,9 +285,6 @@ class DocPixieCLI:
                     ConversationMessage(role="assistant", content=result.answer)
                 )
 
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
-
             except KeyboardInterrupt:
                 print("\n\n👋 Interrupted. Goodbye!")
                 break
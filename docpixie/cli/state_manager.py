@@ -2,21 +2,36 @@
 State management for DocPixie CLI application
 """
 
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Any, Set
-from docpixie import ConversationMessage
+from typing import Deque, List, Optional, Any, Set
+from docpixie.models.agent import ConversationMessage
 from docpixie.models.document import Document
 from .config import get_config_manager
-from .conversation_storage import ConversationStorage
+from .conversation_storage import ConversationStorage, ConversationMetadata
+
+# Status bar layout; the conversation segment is only shown when one is active
+_STATUS_TEMPLATE = "📄: {doc_count} | 🧠: {text_model} | 👁️: {vision_model}{conversation}"
+_CONVERSATION_STATUS_TEMPLATE = " | 💬: {name} | 💰: {cost}"
 
 
 class AppStateManager:
     """Manages application state including conversations, documents, and UI state"""
     
     def __init__(self):
+        self.config_manager = get_config_manager()
+        # Messages kept per conversation; older ones drop off as new ones arrive
+        self.max_conversation_history = self.config_manager.config.max_conversation_history
+        
         self.indexed_documents: List[Document] = []
-        self.conversation_history: List[ConversationMessage] = []
+        # Ids of indexed_documents, kept in step with it for conversation saves;
+        # always replaced rather than mutated so saved metadata can share it
+        self._indexed_doc_ids: List[str] = []
+        # Names of indexed_documents, matched against PDF stems in the documents folder
+        self._indexed_names: Set[str] = set()
+        self.conversation_history: Deque[ConversationMessage] = deque(maxlen=self.max_conversation_history)
         self.current_conversation_id: Optional[str] = None
+        self.unsaved_messages = 0
         self.documents_folder = Path("./documents")
         self.processing = False
         
@@ -29,105 +44,220 @@ class AppStateManager:
         self.current_plan: Optional[Any] = None
         self.completed_tasks: Set = set()
         
-        self.config_manager = get_config_manager()
         self.conversation_storage = ConversationStorage()
+        
+        # Status bar inputs, refreshed only when they change so rendering does no I/O
+        self.current_conversation_meta = None
+        self._text_model_short = ""
+        self._vision_model_short = ""
+        self.refresh_model_names()
     
-    def get_status_text(self) -> str:
-        """Get current status bar text with emoji prefixes"""
+    def refresh_model_names(self) -> None:
+        """Re-read the configured models for the status bar"""
         text_model, vision_model = self.config_manager.get_models()
-        doc_count = len(self.indexed_documents)
-
-        segments = [
-            f"📄: {doc_count}",
-            f"🧠: {text_model.split('/')[-1]}",
-            f"👁️: {vision_model.split('/')[-1]}",
-        ]
-
-        if self.current_conversation_id:
-            conversations = self.conversation_storage.list_local_conversations()
-            current_conv = next(
-                (conv for conv in conversations if conv.id == self.current_conversation_id),
-                None,
+        self._text_model_short = text_model.split('/')[-1]
+        self._vision_model_short = vision_model.split('/')[-1]
+    
+    @property
+    def current_conversation_meta(self) -> Optional[ConversationMetadata]:
+        """Metadata of the current conversation, as last loaded or saved"""
+        return self._current_conversation_meta
+    
+    @current_conversation_meta.setter
+    def current_conversation_meta(self, metadata: Optional[ConversationMetadata]) -> None:
+        self._current_conversation_meta = metadata
+        # Pre-format the conversation segment of the status bar
+        if metadata:
+            # Conversation name (truncate to 20 chars, add ellipsis if longer)
+            conv_name = metadata.name[:20] + ("..." if len(metadata.name) > 20 else "")
+            total_cost = metadata.total_cost or 0.0
+            cost = f"{total_cost:.6f}" if total_cost < 0.01 else f"{total_cost:.4f}"
+            self._conversation_status = _CONVERSATION_STATUS_TEMPLATE.format_map(
+                {"name": conv_name, "cost": cost}
             )
-            if current_conv:
-                # Conversation name (truncate to 20 chars, add ellipsis if longer)
-                conv_name = current_conv.name[:20] + ("..." if len(current_conv.name) > 20 else "")
-                segments.append(f"💬: {conv_name}")
-
-                # Total cost formatting
-                total_cost = getattr(current_conv, "total_cost", 0.0) or 0.0
-                if total_cost < 0.01:
-                    segments.append(f"💰: {total_cost:.6f}")
-                else:
-                    segments.append(f"💰: {total_cost:.4f}")
-
-        return " | ".join(segments)
+        else:
+            self._conversation_status = ""
+    
+    def get_status_text(self) -> str:
+        """Get current status bar text with emoji prefixes"""
+        return _STATUS_TEMPLATE.format_map({
+            "doc_count": len(self.indexed_documents),
+            "text_model": self._text_model_short,
+            "vision_model": self._vision_model_short,
+            "conversation": self._conversation_status if self.current_conversation_id else "",
+        })
+    
+    @property
+    def doc_ids(self) -> List[str]:
+        """Ids of the indexed documents; treat as read-only"""
+        return self._indexed_doc_ids
+    
+    @property
+    def indexed_names(self) -> Set[str]:
+        """Names of the indexed documents; treat as read-only"""
+        return self._indexed_names
     
     def add_document(self, document: Document) -> None:
         """Add a document to the indexed documents list"""
-        if not any(existing.id == document.id for existing in self.indexed_documents):
-            self.indexed_documents.append(document)
+        self.add_documents([document])
+    
+    def add_documents(self, documents: List[Document]) -> List[Document]:
+        """Add documents not already indexed, returning the ones added"""
+        existing_ids = set(self._indexed_doc_ids)
+        added = []
+        for doc in documents:
+            if doc.id not in existing_ids:
+                existing_ids.add(doc.id)
+                added.append(doc)
+        if added:
+            self.indexed_documents.extend(added)
+            self._indexed_doc_ids = self._indexed_doc_ids + [doc.id for doc in added]
+            self._indexed_names.update(doc.name for doc in added)
+        return added
     
     def remove_document(self, document_id: str) -> bool:
         """Remove a document from the indexed documents list"""
         for doc in self.indexed_documents[:]:
             if doc.id == document_id:
                 self.indexed_documents.remove(doc)
+                self._indexed_doc_ids = [d.id for d in self.indexed_documents]
+                self._indexed_names = {d.name for d in self.indexed_documents}
                 return True
         return False
     
+    def remove_documents(self, document_ids: List[str]) -> List[Document]:
+        """Remove several documents in one pass, returning the ones removed"""
+        to_remove = set(document_ids)
+        kept, removed = [], []
+        for doc in self.indexed_documents:
+            (removed if doc.id in to_remove else kept).append(doc)
+        self.indexed_documents = kept
+        if removed:
+            self._indexed_doc_ids = [doc.id for doc in kept]
+            self._indexed_names = {doc.name for doc in kept}
+        return removed
+    
+    def set_documents(self, documents: List[Document]) -> None:
+        """Replace the indexed documents list"""
+        self.indexed_documents = list(documents)
+        self._indexed_doc_ids = [doc.id for doc in self.indexed_documents]
+        self._indexed_names = {doc.name for doc in self.indexed_documents}
+    
     def clear_documents(self) -> None:
         """Clear all indexed documents"""
         self.indexed_documents.clear()
+        self._indexed_doc_ids = []
+        self._indexed_names = set()
     
     def add_conversation_message(self, message: ConversationMessage) -> None:
         """Add a message to conversation history"""
         self.conversation_history.append(message)
-    
-    def limit_conversation_history(self, max_messages: int = 20) -> None:
-        """Limit conversation history to maximum number of messages"""
-        if len(self.conversation_history) > max_messages:
-            self.conversation_history = self.conversation_history[-max_messages:]
+        self.unsaved_messages += 1
     
     def clear_conversation_history(self) -> None:
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self.unsaved_messages = 0
     
     def set_current_conversation(self, conversation_id: Optional[str]) -> None:
         """Set the current conversation ID"""
         self.current_conversation_id = conversation_id
+        self.current_conversation_meta = (
+            self.conversation_storage.get_conversation_metadata(conversation_id)
+            if conversation_id else None
+        )
     
     def create_new_conversation(self) -> str:
         """Create a new conversation and return its ID"""
-        doc_ids = [doc.id for doc in self.indexed_documents]
-        self.current_conversation_id = self.conversation_storage.create_new_conversation(doc_ids)
-        self.conversation_history = []
+        self.current_conversation_id = self.conversation_storage.create_new_conversation(
+            self.doc_ids
+        )
+        self.current_conversation_meta = self.conversation_storage.get_conversation_metadata(
+            self.current_conversation_id
+        )
+        self.conversation_history.clear()
+        self.unsaved_messages = 0
         return self.current_conversation_id
     
+    async def create_new_conversation_async(self) -> str:
+        """Create a new conversation, writing it to disk in a worker thread"""
+        storage = self.conversation_storage
+        conversation_id = await storage.create_new_conversation_async(self.doc_ids)
+        self.current_conversation_id = conversation_id
+        self.current_conversation_meta = await storage.get_conversation_metadata_async(conversation_id)
+        self.conversation_history.clear()
+        self.unsaved_messages = 0
+        return conversation_id
+    
     def load_conversation(self, conversation_id: str) -> bool:
         """Load a conversation by ID"""
         result = self.conversation_storage.load_conversation(conversation_id)
+        return self._apply_loaded_conversation(conversation_id, result)
+    
+    async def load_conversation_async(self, conversation_id: str) -> bool:
+        """Load a conversation by ID, reading it from disk in a worker thread"""
+        result = await self.conversation_storage.load_conversation_async(conversation_id)
+        return self._apply_loaded_conversation(conversation_id, result)
+    
+    def _apply_loaded_conversation(self, conversation_id: str, result: Optional[Any]) -> bool:
+        """Make a loaded (metadata, messages) pair the current conversation"""
         if result:
             metadata, messages = result
             self.current_conversation_id = conversation_id
-            self.conversation_history = messages
+            self.current_conversation_meta = metadata
+            self.conversation_history = deque(messages, maxlen=self.max_conversation_history)
+            self.unsaved_messages = 0
             return True
         return False
     
     def save_current_conversation(self) -> None:
         """Save the current conversation if it exists"""
+        new_count = self.unsaved_messages
+        self.unsaved_messages = 0
         if self.current_conversation_id and self.conversation_history:
-            doc_ids = [doc.id for doc in self.indexed_documents]
-            self.conversation_storage.save_conversation(
+            metadata = self.conversation_storage.save_conversation(
                 self.current_conversation_id,
-                self.conversation_history,
-                doc_ids
+                list(self.conversation_history),
+                self.doc_ids,
+                new_count
             )
+            if metadata:
+                self.current_conversation_meta = metadata
+            else:
+                # Nothing was appended; keep these messages pending for the next save
+                self.unsaved_messages += new_count
+    
+    async def save_current_conversation_async(self) -> None:
+        """Save a snapshot of the current conversation from a worker thread"""
+        new_count = self.unsaved_messages
+        self.unsaved_messages = 0
+        if not (self.current_conversation_id and self.conversation_history):
+            return
+
+        conversation_id = self.current_conversation_id
+        messages = list(self.conversation_history)
+        metadata = await self.conversation_storage.save_conversation_async(
+            conversation_id,
+            messages,
+            self.doc_ids,
+            new_count
+        )
+        if conversation_id != self.current_conversation_id:
+            return
+        if metadata:
+            self.current_conversation_meta = metadata
+        else:
+            # Nothing was appended; keep these messages pending for the next save
+            self.unsaved_messages += new_count
     
     def get_last_conversation_id(self) -> Optional[str]:
         """Get the ID of the last conversation"""
         return self.conversation_storage.get_last_conversation()
     
+    async def get_last_conversation_id_async(self) -> Optional[str]:
+        """Get the ID of the last conversation without blocking the event loop"""
+        return await self.conversation_storage.get_last_conversation_async()
+    
     def set_processing(self, processing: bool) -> None:
         """Set processing state"""
         self.processing = processing
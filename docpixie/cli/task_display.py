@@ -4,7 +4,6 @@ Task display management for DocPixie CLI
 
 from typing import TYPE_CHECKING, Any
 from .state_manager import AppStateManager
-from .widgets import ChatArea
 
 if TYPE_CHECKING:
     from .app import DocPixieTUI
@@ -19,7 +18,7 @@ class TaskDisplayManager:
     
     def display_task_update(self, event_type: str, data: Any) -> None:
         """Display task plan updates"""
-        chat_log = self.app.query_one("#chat-log", ChatArea)
+        chat_log = self.app.chat_log
         
         if event_type == 'plan_created':
             plan = data
@@ -5,7 +5,7 @@ Replaces RichLog with reactive status updates and content management
 
 import asyncio
 import random
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from textual.widgets import Static
 from textual.containers import Container, Vertical, ScrollableContainer
 from textual.timer import Timer
@@ -14,6 +14,29 @@ from rich.panel import Panel
 from rich.text import Text
 
 
+class _ChatBatch:
+    """
+    Collects markup lines written during one logical step and adds them
+    to the chat as a single widget when the block exits.
+    """
+
+    def __init__(self, chat_area: "ChatArea"):
+        self._chat_area = chat_area
+        self._parts: List[str] = []
+
+    def write(self, content: str) -> None:
+        """Queue a line of markup"""
+        self._parts.append(content)
+
+    def __enter__(self) -> "_ChatBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._parts:
+            self._chat_area.write("".join(self._parts))
+        return False
+
+
 class ChatArea(ScrollableContainer):
     """
     Reactive chat area widget that can update specific content parts
@@ -70,9 +93,7 @@ class ChatArea(ScrollableContainer):
 
     def add_user_message(self, content: str):
         """Add a user message to the chat"""
-        user_md = Markdown(content)
-        user_panel = Panel(user_md, border_style="green", expand=True, padding=(0, 1))
-        widget = Static(user_panel)
+        widget = self._make_message_widget("user", content)
 
         self.content_container.mount(widget)
         self.message_widgets.append(widget)
@@ -81,15 +102,32 @@ class ChatArea(ScrollableContainer):
 
     def add_assistant_message(self, content: str):
         """Add an assistant message to the chat"""
-        md = Markdown(content)
-        assistant_panel = Panel(md, border_style="blue", expand=True, padding=(0, 1))
-        widget = Static(assistant_panel)
+        widget = self._make_message_widget("assistant", content)
 
         self.content_container.mount(widget)
         self.message_widgets.append(widget)
 
         self._scroll_to_latest()
 
+    def add_messages_bulk(self, messages: List[Tuple[str, str]]):
+        """Add many (role, content) messages with a single mount and scroll"""
+        if not messages:
+            return
+
+        widgets = [self._make_message_widget(role, content) for role, content in messages]
+
+        with self.app.batch_update():
+            self.content_container.mount(*widgets)
+            self.message_widgets.extend(widgets)
+
+        self._scroll_to_latest()
+
+    def _make_message_widget(self, role: str, content: str) -> Static:
+        """Build the panel widget for a user or assistant message"""
+        border_style = "green" if role == "user" else "blue"
+        panel = Panel(Markdown(content), border_style=border_style, expand=True, padding=(0, 1))
+        return Static(panel)
+
     def add_static_text(self, content: str, classes: str = ""):
         """Add static text content"""
         widget = Static(content, classes=classes)
@@ -376,6 +414,10 @@ class ChatArea(ScrollableContainer):
                 pass
         self.spinner_tasks.clear()
 
+    def batch(self) -> _ChatBatch:
+        """Group several markup writes into one chat entry"""
+        return _ChatBatch(self)
+
     def write(self, content):
         """Compatibility method for RichLog replacement"""
         if isinstance(content, (Panel, Markdown)):
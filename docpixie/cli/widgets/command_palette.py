@@ -104,6 +104,9 @@ class DocPixieCommandPalette(Container):
     
     def on_mount(self):
         """Initialize the command palette"""
+        # Children touched on every keystroke; look them up once
+        self._filter_display = self.query_one("#filter-display", Static)
+        self._command_list = self.query_one("#command-list", ListView)
         self._update_commands("")
     
     def show(self, filter_text: str = ""):
@@ -124,7 +127,7 @@ class DocPixieCommandPalette(Container):
         self.current_filter = filter_text
         self._update_commands(filter_text)
         
-        filter_display = self.query_one("#filter-display", Static)
+        filter_display = self._filter_display
         if filter_text:
             filter_display.update(f"Filter: {filter_text}")
         else:
@@ -142,7 +145,7 @@ class DocPixieCommandPalette(Container):
         
         self.selected_index = 0
         
-        list_view = self.query_one("#command-list", ListView)
+        list_view = self._command_list
         list_view.clear()
         
         self.command_items = []
@@ -168,7 +171,7 @@ class DocPixieCommandPalette(Container):
         if 0 <= self.selected_index < len(self.command_items):
             self.command_items[self.selected_index].add_class("command-item-selected")
             
-            list_view = self.query_one("#command-list", ListView)
+            list_view = self._command_list
             list_view.scroll_to_widget(self.command_items[self.selected_index])
     
     def move_selection_up(self):
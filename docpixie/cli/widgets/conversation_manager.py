@@ -195,9 +195,11 @@ class ConversationManagerDialog(ModalScreen):
     }
     """
 
-    def __init__(self, current_conversation_id: Optional[str] = None):
+    def __init__(self, current_conversation_id: Optional[str] = None,
+                 conversation_storage: Optional[ConversationStorage] = None):
         super().__init__()
-        self.conversation_storage = ConversationStorage()
+        # Share the app's storage so its cached metadata sees our deletes
+        self.conversation_storage = conversation_storage or ConversationStorage()
         self.conversations: List[ConversationMetadata] = []
         self.current_conversation_id = current_conversation_id
         self.selected_items: Set[str] = set()  # Conversation IDs
@@ -493,7 +495,7 @@ class ConversationManagerDialog(ModalScreen):
         """Handle conversation deletion message"""
         deleted_count = 0
         for conv_id in event.conversation_ids:
-            success = self.conversation_storage.delete_conversation(conv_id)
+            success = await self.conversation_storage.delete_conversation_async(conv_id)
             if success:
                 deleted_count += 1
                 if conv_id in self.selected_items:
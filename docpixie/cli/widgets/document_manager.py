@@ -16,6 +16,9 @@ from rich.text import Text
 
 from docpixie.models.document import Document
 
+# PDFs indexed at the same time by the document manager
+INDEXING_CONCURRENCY = 4
+
 
 class DocumentRemoved(Message):
     """Message sent when documents are removed"""
@@ -433,6 +436,11 @@ class DocumentManagerDialog(ModalScreen):
 
     async def on_mount(self):
         """Load documents when dialog mounts"""
+        # Widgets refreshed on every key press and indexed file; look them up once
+        self._document_list = self.query_one("#document-list", ListView)
+        self._title_display = self.query_one("#title", Static)
+        self._selection_info = self.query_one("#selection-info", Static)
+
         self._scan_and_load_documents()
         self._update_title()
         self._update_selection_info()
@@ -447,15 +455,24 @@ class DocumentManagerDialog(ModalScreen):
         indexed_map = {doc.name: doc for doc in self.app.state_manager.indexed_documents}
 
         if self.documents_folder.exists():
-            pdf_files = sorted(self.documents_folder.glob("*.pdf"))
+            # Reuse the folder scan the app already made unless the folder changed
+            pdf_names = sorted(self.app.docpixie_manager.scan_pdf_names())
 
-            for pdf_file in pdf_files:
+            for pdf_name in pdf_names:
+                pdf_file = self.documents_folder / pdf_name
+                try:
+                    file_size = pdf_file.stat().st_size
+                except OSError:
+                    file_size = 0
+                # Scanned names all end in '.pdf', so the stem is a slice
+                stem = pdf_name[:-4]
+                document = indexed_map.get(stem)
                 item = {
-                    'name': pdf_file.stem,
+                    'name': stem,
                     'pdf_path': pdf_file,
-                    'is_indexed': pdf_file.stem in indexed_map,
-                    'document': indexed_map.get(pdf_file.stem),
-                    'file_size': pdf_file.stat().st_size if pdf_file.exists() else 0
+                    'is_indexed': document is not None,
+                    'document': document,
+                    'file_size': file_size
                 }
                 self.all_items.append(item)
 
@@ -463,7 +480,7 @@ class DocumentManagerDialog(ModalScreen):
 
     def _load_document_list(self):
         """Load and display the document list"""
-        list_view = self.query_one("#document-list", ListView)
+        list_view = self._document_list
         no_docs_msg = self.query_one("#no-documents", Static)
 
         if not self.all_items:
@@ -500,7 +517,7 @@ class DocumentManagerDialog(ModalScreen):
 
     def _update_title(self):
         """Update the title with document counts"""
-        title = self.query_one("#title", Static)
+        title = self._title_display
         total = len(self.all_items)
         indexed = sum(1 for item in self.all_items if item['is_indexed'])
 
@@ -557,7 +574,7 @@ class DocumentManagerDialog(ModalScreen):
             self.document_items[self.focused_index].add_class("document-item-selected")
 
             # Scroll to focused item
-            list_view = self.query_one("#document-list", ListView)
+            list_view = self._document_list
             list_view.scroll_to_widget(self.document_items[self.focused_index])
 
     def _toggle_selection(self, index: int):
@@ -597,7 +614,7 @@ class DocumentManagerDialog(ModalScreen):
 
     def _update_selection_info(self):
         """Update the selection info display"""
-        info = self.query_one("#selection-info", Static)
+        info = self._selection_info
         count = len(self.selected_items)
 
         if count == 0:
@@ -722,10 +739,36 @@ class DocumentManagerDialog(ModalScreen):
         spinner_task = asyncio.create_task(self._update_spinner_animation(stop_spinner))
 
         try:
-            for i, pdf_file in enumerate(pdf_files, 1):
-                try:
-                    # Update state for current file
-                    completed = i - 1
+            if self.docpixie:
+                loop = asyncio.get_running_loop()
+                finished: asyncio.Queue = asyncio.Queue()
+                docpixie = self.docpixie
+
+                async def index_one(semaphore: asyncio.Semaphore, pdf_file: Path) -> None:
+                    async with semaphore:
+                        try:
+                            document = await docpixie.add_document(str(pdf_file), None, pdf_file.stem)
+                            outcome = (pdf_file, document, None)
+                        except Exception as e:
+                            outcome = (pdf_file, None, e)
+                    loop.call_soon_threadsafe(finished.put_nowait, outcome)
+
+                async def index_all() -> None:
+                    semaphore = asyncio.Semaphore(min(INDEXING_CONCURRENCY, total))
+                    await asyncio.gather(*(index_one(semaphore, pdf_file) for pdf_file in pdf_files))
+
+                # Files are indexed concurrently on a worker-thread event loop,
+                # keeping the UI loop free to repaint progress
+                worker = loop.run_in_executor(None, asyncio.run, index_all())
+                # Wakes the loop below if the worker stops before reporting every file
+                worker.add_done_callback(lambda _: finished.put_nowait(None))
+
+                for completed in range(1, total + 1):
+                    outcome = await finished.get()
+                    if outcome is None:
+                        break
+                    pdf_file, document, error = outcome
+
                     progress = int(completed / total * 100)
                     filled = int(progress / 100 * 30)
                     empty = 30 - filled
@@ -738,22 +781,17 @@ class DocumentManagerDialog(ModalScreen):
                     # Update shared state
                     self._current_indexing_state = {
                         'filename': filename,
-                        'current': i,
+                        'current': completed,
                         'total': total,
                         'progress': progress,
                         'bar_filled': '█' * filled,
                         'bar_empty': '░' * empty
                     }
 
-                    # Run sync method in executor
-                    if self.docpixie:
-                        document = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            self.docpixie.add_document_sync,
-                            str(pdf_file),
-                            None,
-                            pdf_file.stem
-                        )
+                    try:
+                        if error is not None:
+                            raise error
+
                         indexed_docs.append(document)
 
                         # Update the item immediately
@@ -767,8 +805,17 @@ class DocumentManagerDialog(ModalScreen):
                         self._refresh_specific_item(document.name)
                         self._update_title()
 
-                except Exception as e:
-                    self.app.notify(f"Failed to index {pdf_file.name}: {e}", severity="error")
+                    except Exception as e:
+                        self.app.notify(f"Failed to index {pdf_file.name}: {e}", severity="error")
+
+                await asyncio.wait({worker})
+                if worker.cancelled():
+                    self.app.notify("Indexing was interrupted", severity="error")
+                elif worker.exception() is not None:
+                    error = worker.exception()
+                    self.app.notify(
+                        f"Indexing stopped early: {error or type(error).__name__}", severity="error"
+                    )
 
         finally:
             # Stop spinner animation
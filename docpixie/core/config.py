@@ -40,6 +40,14 @@ class DocPixieConfig:
     max_agent_iterations: int = 5  # Maximum adaptive planning iterations
     max_pages_per_task: int = 6    # Maximum pages to analyze per task
     max_tasks_per_plan: int = 4    # Maximum tasks in initial plan
+    max_findings_tokens: int = 400  # Task findings shown to the planner when updating the plan
+    structured_outputs: bool = True  # Request schema-constrained JSON where the provider supports it
+
+    # Initial plan cache (skips the planning LLM call for repeated queries)
+    plan_cache_enabled: bool = False             # Opt-in: repeated queries reuse an earlier plan
+    plan_cache_size: int = 100                   # Max plans kept in memory
+    plan_cache_ttl_seconds: int = 7 * 24 * 3600  # Cached plans expire after 7 days
+    plan_cache_path: Optional[str] = None        # Directory for a persistent disk tier
 
     # Conversation Processing Settings
     max_conversation_turns: int = 8  # When to start summarizing conversation
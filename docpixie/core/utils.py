@@ -2,6 +2,18 @@
 Core utility functions for DocPixie
 """
 import re
+import json
+import string
+from functools import lru_cache
+from typing import Callable
+
+# orjson is an optional C-accelerated parser; its JSONDecodeError subclasses
+# json.JSONDecodeError, so callers keep catching the stdlib exception
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 def sanitize_llm_json(response: str) -> str:
@@ -32,4 +44,102 @@ def sanitize_llm_json(response: str) -> str:
     if match:
         cleaned = match.group(1).strip()
     
-    return cleaned
\ No newline at end of file
+    return cleaned
+
+
+def parse_llm_json(response: str):
+    """
+    Sanitize an LLM response and parse it as JSON.
+
+    Uses orjson when installed, falling back to the standard library.
+
+    Args:
+        response: Raw response string from LLM
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the sanitized response is not valid JSON
+    """
+    return _json_loads(sanitize_llm_json(response))
+
+
+def compile_prompt_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format prompt template into a reusable renderer.
+
+    The template is parsed once (escaped braces resolved, adjacent literals
+    merged), so rendering is a single join instead of re-parsing the whole
+    template on every call. Only plain ``{name}`` fields are supported.
+
+    Args:
+        template: Prompt template in str.format syntax
+
+    Returns:
+        Callable that takes the template fields as keyword arguments
+
+    Raises:
+        ValueError: If the template uses positional, indexed, format-spec or conversion fields
+    """
+    literals = [""]
+    fields = []
+
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        literals[-1] += literal
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or format_spec or conversion:
+            raise ValueError(f"Unsupported prompt template field: {{{field_name}}}")
+        fields.append(field_name)
+        literals.append("")
+
+    head = literals[0]
+    tail = list(zip(fields, literals[1:]))
+
+    def render(**values) -> str:
+        parts = [head]
+        for name, literal in tail:
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+# Rough characters-per-token ratio used when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    """Load the tiktoken encoder once, or None if tiktoken is unavailable"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        return None
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to a token budget.
+
+    Uses tiktoken when installed so the budget is exact; otherwise falls back
+    to an approximate character budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+
+    Returns:
+        The text, cut to at most max_tokens tokens
+    """
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+
+    tokens = encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
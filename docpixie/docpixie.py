@@ -75,7 +75,7 @@ class DocPixie:
         
         # Initialize AI components
         self.provider = create_provider(config)
-        self.summarizer = PageSummarizer(config)
+        self.summarizer = PageSummarizer(config, self.provider)
         self.agent = PixieRAGAgent(self.provider, self.storage, config)
         
         logger.info(f"Initialized DocPixie with {config.provider} provider and {type(self.storage).__name__} storage")
@@ -326,8 +326,7 @@ class DocPixie:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        # Cleanup if needed
-        pass
+        await self.aclose()
     
     def __enter__(self):
         """Sync context manager entry"""
@@ -335,8 +334,11 @@ class DocPixie:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Sync context manager exit"""
-        # Cleanup if needed
-        pass
+        sync_wrapper(self.aclose())
+    
+    async def aclose(self):
+        """Release the provider's HTTP connection pool"""
+        await self.provider.aclose()
 
 
 # Convenience factory functions
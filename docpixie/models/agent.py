@@ -4,7 +4,7 @@ Agent models and data structures for DocPixie RAG Agent
 
 import uuid
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 from datetime import datetime
 
@@ -38,7 +38,7 @@ class ConversationMessage:
 @dataclass
 class AgentTask:
     """Represents a single task in the agent's plan"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     name: str = ""
     description: str = ""
     status: TaskStatus = TaskStatus.PENDING
@@ -52,12 +52,128 @@ class AgentTask:
             raise ValueError("Task description cannot be empty")
 
 
+@dataclass
+class TaskSpec:
+    """A task as proposed by the planner model, before it is added to a plan"""
+    name: str
+    description: str = ""
+    document: str = ""  # Document ID suggested by the model (not yet validated)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_name: str = "Unnamed Task") -> 'TaskSpec':
+        """Create from a decoded LLM task object, tolerating missing or null fields"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Task must be a JSON object, got {type(data).__name__}")
+        return cls(
+            name=str(data.get("name") or default_name),
+            description=str(data.get("description") or ""),
+            document=str(data.get("document") or "")
+        )
+
+
+@dataclass
+class TaskModification:
+    """A change to an existing pending task requested by the planner model"""
+    task_id: str
+    new_name: Optional[str] = None
+    new_description: Optional[str] = None
+    new_document: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TaskModification':
+        """Create from a decoded LLM modification object"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Task modification must be a JSON object, got {type(data).__name__}")
+        return cls(
+            task_id=str(data.get("task_id") or ""),
+            new_name=data.get("new_name"),
+            new_description=data.get("new_description"),
+            new_document=data.get("new_document")
+        )
+
+
+@dataclass
+class InitialPlanResponse:
+    """Validated initial planning response"""
+    tasks: List[TaskSpec] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InitialPlanResponse':
+        """Create from the decoded planner JSON"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Plan must be a JSON object, got {type(data).__name__}")
+        tasks = data.get("tasks") or []
+        if not isinstance(tasks, list):
+            raise ValueError("Plan 'tasks' must be a list")
+        return cls(tasks=[TaskSpec.from_dict(task) for task in tasks])
+
+
+@dataclass
+class PlanUpdateResponse:
+    """Validated plan update response (batched add/remove/modify)"""
+    reason: str = "No reason provided"
+    add: List[TaskSpec] = field(default_factory=list)
+    remove: List[str] = field(default_factory=list)
+    modify: List[TaskModification] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if the update changes the plan at all"""
+        return bool(self.add or self.remove or self.modify)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PlanUpdateResponse':
+        """Create from the decoded planner JSON, accepting the legacy single-action format"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Plan update must be a JSON object, got {type(data).__name__}")
+
+        action = data.get("action")
+        if action is not None:
+            # Legacy single-action responses map onto the batch schema
+            add = data.get("new_tasks") if action == "add_tasks" else None
+            remove = data.get("tasks_to_remove") if action == "remove_tasks" else None
+            modify = data.get("modified_tasks") if action == "modify_tasks" else None
+        else:
+            add, remove, modify = data.get("add"), data.get("remove"), data.get("modify")
+
+        for key, value in (("add", add), ("remove", remove), ("modify", modify)):
+            if value is not None and not isinstance(value, list):
+                raise ValueError(f"Plan update '{key}' must be a list")
+
+        return cls(
+            reason=str(data.get("reason") or cls.reason),
+            add=[TaskSpec.from_dict(task, default_name="New Task") for task in add or []],
+            remove=[str(task_id) for task_id in remove or []],
+            modify=[TaskModification.from_dict(change) for change in modify or []]
+        )
+
+
 @dataclass
 class TaskPlan:
     """Represents the agent's current task plan"""
     initial_query: str
     tasks: List[AgentTask] = field(default_factory=list)
     current_iteration: int = 0
+    _task_index: Dict[str, AgentTask] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Rendered status/progress lines, kept in plan order and updated per task change
+    _status_lines: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _progress_lines: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index tasks by id for constant-time lookups"""
+        self._task_index = {task.id: task for task in self.tasks}
+        self._status_lines = {task.id: self._status_line(task) for task in self.tasks}
+        self._progress_lines = {
+            task.id: f"✓ {task.name}" for task in self.tasks if task.status == TaskStatus.COMPLETED
+        }
+
+    @staticmethod
+    def _status_line(task: AgentTask) -> str:
+        return f"- {task.name} [{task.id}]: {task.status.value}"
+
+    def get_task(self, task_id: str) -> Optional[AgentTask]:
+        """Get a task by id"""
+        return self._task_index.get(task_id)
 
     def get_next_pending_task(self) -> Optional[AgentTask]:
         """Get the next task that needs to be executed"""
@@ -67,23 +183,67 @@ class TaskPlan:
         """Check if there are any pending tasks"""
         return any(task.status == TaskStatus.PENDING for task in self.tasks)
 
+    def mark_task_in_progress(self, task_id: str) -> bool:
+        """Mark a task as in progress"""
+        return self._set_task_status(task_id, TaskStatus.IN_PROGRESS)
+
     def mark_task_completed(self, task_id: str) -> bool:
         """Mark a task as completed"""
-        task = next((t for t in self.tasks if t.id == task_id), None)
-        if task:
-            task.status = TaskStatus.COMPLETED
-            return True
-        return False
+        if not self._set_task_status(task_id, TaskStatus.COMPLETED):
+            return False
+        self._progress_lines[task_id] = f"✓ {self._task_index[task_id].name}"
+        return True
+
+    def update_task(
+        self,
+        task_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        document: Optional[str] = None
+    ) -> bool:
+        """Change a task's name, description or assigned document"""
+        task = self.get_task(task_id)
+        if not task:
+            return False
+        if name is not None:
+            task.name = name
+        if description is not None:
+            task.description = description
+        if document is not None:
+            task.document = document
+        self._status_lines[task_id] = self._status_line(task)
+        return True
 
     def add_task(self, task: AgentTask):
         """Add a new task to the plan"""
         self.tasks.append(task)
+        self._task_index[task.id] = task
+        self._status_lines[task.id] = self._status_line(task)
 
     def remove_task(self, task_id: str) -> bool:
         """Remove a task from the plan"""
-        original_length = len(self.tasks)
+        if self._task_index.pop(task_id, None) is None:
+            return False
         self.tasks = [t for t in self.tasks if t.id != task_id]
-        return len(self.tasks) < original_length
+        self._status_lines.pop(task_id, None)
+        self._progress_lines.pop(task_id, None)
+        return True
+
+    def get_status_text(self) -> str:
+        """Get one status line per task, in plan order"""
+        return "\n".join(self._status_lines.values())
+
+    def get_progress_text(self) -> str:
+        """Get one line per completed task, in completion order"""
+        return "\n".join(self._progress_lines.values())
+
+    def _set_task_status(self, task_id: str, status: TaskStatus) -> bool:
+        task = self.get_task(task_id)
+        if not task:
+            return False
+        task.status = status
+        self._status_lines[task_id] = self._status_line(task)
+        return True
 
     def get_completed_tasks(self) -> List[AgentTask]:
         """Get all completed tasks"""
@@ -3,7 +3,7 @@ Anthropic Claude provider for raw API operations
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from .base import BaseProvider, ProviderError
 from ..core.config import DocPixieConfig
@@ -23,7 +23,10 @@ class AnthropicProvider(BaseProvider):
         # Import here to make it optional dependency
         try:
             import anthropic
-            self.client = anthropic.AsyncAnthropic(api_key=config.anthropic_api_key)
+            self.client = anthropic.AsyncAnthropic(
+                api_key=config.anthropic_api_key,
+                http_client=self._http_client
+            )
         except ImportError:
             raise ImportError("Anthropic library not found. Install with: pip install anthropic")
         
@@ -33,23 +36,33 @@ class AnthropicProvider(BaseProvider):
         self, 
         messages: List[Dict[str, Any]], 
         max_tokens: int = 300, 
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Process text-only messages through Anthropic API"""
+        """Process text-only messages through Anthropic API (json_schema is ignored; JSON is prompt-driven)"""
         try:
             # Convert system message format for Anthropic
-            claude_messages = self._prepare_claude_text_messages(messages)
+            system_blocks, claude_messages = self._prepare_claude_text_messages(messages)
             
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=claude_messages
-            )
+            request = {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "messages": claude_messages
+            }
+            if system_blocks:
+                request["system"] = system_blocks
+            
+            response = await self.client.messages.create(**request)
             
             result = response.content[0].text.strip()
             logger.debug(f"Anthropic text response: {result[:50]}...")
             
+            usage = getattr(response, "usage", None)
+            self.last_cached_tokens = getattr(usage, "cache_read_input_tokens", None)
+            if self.last_cached_tokens:
+                logger.debug(f"Anthropic prompt cache hit: {self.last_cached_tokens} tokens")
+            
             return result
             
         except Exception as e:
@@ -83,30 +96,31 @@ class AnthropicProvider(BaseProvider):
             logger.error(f"Anthropic multimodal processing failed: {e}")
             raise ProviderError(f"Multimodal processing failed: {e}", "anthropic")
     
-    def _prepare_claude_text_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Prepare text-only messages for Claude API (handle system messages)"""
+    def _prepare_claude_text_messages(
+        self,
+        messages: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Prepare text-only messages for Claude API (handle system messages)
+
+        The system message is sent as a top-level cacheable block so static
+        prompts (e.g. the planner instructions) are a stable prefix that
+        Anthropic can serve from its prompt cache across calls.
+        """
+        system_blocks = []
         claude_messages = []
         
         for message in messages:
             if message["role"] == "system":
-                # Claude handles system messages differently - we'll prepend to first user message
-                continue
+                if not system_blocks:
+                    content = message["content"]
+                    system_blocks = (
+                        content if isinstance(content, list)
+                        else self._cached_text_block(content)
+                    )
             else:
                 claude_messages.append(message)
         
-        # Prepend system message content to first user message if present
-        system_content = None
-        for message in messages:
-            if message["role"] == "system":
-                system_content = message["content"]
-                break
-        
-        if system_content and claude_messages and claude_messages[0]["role"] == "user":
-            # Prepend system content to first user message
-            original_content = claude_messages[0]["content"]
-            claude_messages[0]["content"] = f"{system_content}\n\n{original_content}"
-        
-        return claude_messages
+        return system_blocks, claude_messages
     
     def _prepare_claude_multimodal_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepare multimodal messages for Claude API by converting image paths to base64"""
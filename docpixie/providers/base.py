@@ -4,7 +4,7 @@ Base provider interface for vision AI operations
 
 import base64
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 import logging
@@ -28,17 +28,37 @@ class BaseProvider(ABC):
         self.config = config
         self.last_api_cost: Optional[float] = None
         self.total_cost: float = 0.0
+        self.last_cached_tokens: Optional[int] = None
+        self._http_client = self._create_http_client()
 
     @abstractmethod
     async def process_text_messages(
         self,
         messages: List[dict],
         max_tokens: int = 512,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Process text-only messages through the provider API"""
+        """
+        Process text-only messages through the provider API
+
+        json_schema ({"name", "strict", "schema"}) requests structured output on
+        providers that support it; others ignore it and rely on the prompt.
+        """
         pass
 
+    async def process_text_messages_stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 512,
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Stream text-only responses as deltas (default: the full response as one chunk)"""
+        yield await self.process_text_messages(
+            messages, max_tokens=max_tokens, temperature=temperature, json_schema=json_schema
+        )
+
     @abstractmethod
     async def process_multimodal_messages(
         self,
@@ -57,10 +77,59 @@ class BaseProvider(ABC):
         """Get the total accumulated cost"""
         return self.total_cost
 
+    def get_last_cached_tokens(self) -> Optional[int]:
+        """Get prompt tokens served from the provider's prefix cache on the last call"""
+        return self.last_cached_tokens
+
     def reset_cost_tracking(self):
         """Reset cost tracking"""
         self.last_api_cost = None
         self.total_cost = 0.0
+        self.last_cached_tokens = None
+
+    def _response_format(self, json_schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build OpenAI-style structured output arguments for a completion request"""
+        if not json_schema:
+            return {}
+        return {"response_format": {"type": "json_schema", "json_schema": json_schema}}
+
+    def _cached_text_block(self, text: str) -> List[dict]:
+        """Wrap static prompt text in a content block marked for prompt caching"""
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool"""
+        client, self._http_client = self._http_client, None
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                # Pooled connections may belong to a loop that has since closed
+                logger.warning(f"Error closing HTTP client: {e}")
+
+    def _create_http_client(self):
+        """
+        Create a keep-alive connection pool for the provider SDK client
+        Uses HTTP/2 when the optional h2 package is installed; returns None if
+        httpx is unavailable so the SDK falls back to its own client
+        """
+        try:
+            import httpx
+        except ImportError:
+            return None
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            follow_redirects=True
+        )
 
     # Helper methods for image handling (shared by all providers)
 
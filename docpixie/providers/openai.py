@@ -3,7 +3,7 @@ OpenAI GPT-4V provider for raw API operations
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from .base import BaseProvider, ProviderError
 from ..core.config import DocPixieConfig
@@ -23,7 +23,7 @@ class OpenAIProvider(BaseProvider):
         # Import here to make it optional dependency
         try:
             from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=config.openai_api_key)
+            self.client = AsyncOpenAI(api_key=config.openai_api_key, http_client=self._http_client)
         except ImportError:
             raise ImportError("OpenAI library not found. Install with: pip install openai")
         
@@ -33,7 +33,8 @@ class OpenAIProvider(BaseProvider):
         self, 
         messages: List[Dict[str, Any]], 
         max_tokens: int = 300, 
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
         """Process text-only messages through OpenAI API"""
         try:
@@ -41,18 +42,50 @@ class OpenAIProvider(BaseProvider):
                 model=self.config.model,
                 messages=messages,
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                **self._response_format(json_schema)
             )
             
             result = response.choices[0].message.content.strip()
             logger.debug(f"OpenAI text response: {result[:50]}...")
             
+            # OpenAI caches identical prompt prefixes automatically; record hits
+            details = getattr(getattr(response, 'usage', None), 'prompt_tokens_details', None)
+            self.last_cached_tokens = getattr(details, 'cached_tokens', None)
+            
             return result
             
         except Exception as e:
             logger.error(f"OpenAI text processing failed: {e}")
             raise ProviderError(f"Text processing failed: {e}", "openai")
     
+    async def process_text_messages_stream(
+        self, 
+        messages: List[Dict[str, Any]], 
+        max_tokens: int = 300, 
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Stream text-only responses from OpenAI API as content deltas"""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                **self._response_format(json_schema)
+            )
+            
+            self.last_cached_tokens = None
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            
+        except Exception as e:
+            logger.error(f"OpenAI text streaming failed: {e}")
+            raise ProviderError(f"Text streaming failed: {e}", "openai")
+    
     async def process_multimodal_messages(
         self, 
         messages: List[Dict[str, Any]], 
@@ -4,13 +4,16 @@ Uses OpenAI client with OpenRouter's API endpoint
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from .base import BaseProvider, ProviderError
 from ..core.config import DocPixieConfig
 
 logger = logging.getLogger(__name__)
 
+# Model families that require explicit cache_control breakpoints for prompt caching
+_EXPLICIT_CACHE_PREFIXES = ("anthropic/", "google/")
+
 
 class OpenRouterProvider(BaseProvider):
     """OpenRouter provider for raw API operations"""
@@ -26,7 +29,8 @@ class OpenRouterProvider(BaseProvider):
             from openai import AsyncOpenAI
             self.client = AsyncOpenAI(
                 api_key=config.openrouter_api_key,
-                base_url="https://openrouter.ai/api/v1"
+                base_url="https://openrouter.ai/api/v1",
+                http_client=self._http_client
             )
         except ImportError:
             raise ImportError("OpenAI library not found. Install with: pip install openai")
@@ -37,15 +41,17 @@ class OpenRouterProvider(BaseProvider):
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = 300,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
         """Process text-only messages through OpenRouter API"""
         try:
             response = await self.client.chat.completions.create(
                 model=self.config.model,
-                messages=messages,
+                messages=self._prepare_text_messages(messages),
                 max_tokens=max_tokens,
                 temperature=temperature,
+                **self._response_format(json_schema),
                 extra_body= {
                       "usage": {
                         "include": True,
@@ -56,6 +62,9 @@ class OpenRouterProvider(BaseProvider):
             result = response.choices[0].message.content.strip()
             logger.debug(f"OpenRouter text response: {result[:50]}...")
 
+            details = getattr(getattr(response, 'usage', None), 'prompt_tokens_details', None)
+            self.last_cached_tokens = getattr(details, 'cached_tokens', None)
+
             # Track cost if available
             if hasattr(response, 'usage') and hasattr(response.usage, 'cost'):
                 self.last_api_cost = response.usage.cost
@@ -70,6 +79,46 @@ class OpenRouterProvider(BaseProvider):
             logger.error(f"OpenRouter text processing failed: {e}")
             raise ProviderError(f"Text processing failed: {e}", "openrouter")
 
+    async def process_text_messages_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Stream text-only responses from OpenRouter API as content deltas"""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=self._prepare_text_messages(messages),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **self._response_format(json_schema),
+                stream=True,
+                extra_body= {
+                      "usage": {
+                        "include": True,
+                      },
+                },
+            )
+
+            self.last_api_cost = None
+            self.last_cached_tokens = None
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+                # Usage (including cost) arrives on the final chunk
+                usage = getattr(chunk, 'usage', None)
+                if usage is not None and getattr(usage, 'cost', None) is not None:
+                    self.last_api_cost = usage.cost
+                    self.total_cost += usage.cost
+                    logger.debug(f"OpenRouter API cost: ${usage.cost}")
+
+        except Exception as e:
+            logger.error(f"OpenRouter text streaming failed: {e}")
+            raise ProviderError(f"Text streaming failed: {e}", "openrouter")
+
     async def process_multimodal_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -110,6 +159,22 @@ class OpenRouterProvider(BaseProvider):
             logger.error(f"OpenRouter multimodal processing failed: {e}")
             raise ProviderError(f"Multimodal processing failed: {e}", "openrouter")
 
+    def _prepare_text_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Mark the system prompt for caching on models that need explicit breakpoints
+
+        OpenAI-style models cache identical prefixes automatically; Anthropic and
+        Gemini models routed through OpenRouter only do so with cache_control.
+        """
+        if not self.config.model.startswith(_EXPLICIT_CACHE_PREFIXES):
+            return messages
+
+        return [
+            {"role": "system", "content": self._cached_text_block(message["content"])}
+            if message["role"] == "system" and isinstance(message["content"], str)
+            else message
+            for message in messages
+        ]
+
     def _prepare_openai_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepare messages for OpenRouter API by converting image paths to data URLs"""
         processed_messages = []